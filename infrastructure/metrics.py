@@ -0,0 +1,163 @@
+import functools
+import os
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans a cache hit through a slow upstream call.
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], const: str = "") -> str:
+    labels = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    if const:
+        labels = f"{const},{labels}" if labels else const
+    return "{" + labels + "}" if labels else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+    def render(self, const: str = "") -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for labelvalues, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues, const)} {_format_value(value)}")
+        return lines
+
+class _Timer:
+    __slots__ = ("_histogram", "_labelvalues", "_started")
+
+    def __init__(self, histogram: "Histogram", labelvalues: Tuple[str, ...]):
+        self._histogram = histogram
+        self._labelvalues = labelvalues
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._histogram.observe(time.perf_counter() - self._started, *self._labelvalues)
+
+class Histogram:
+    """
+    Cumulative histogram per label set, rendered with `_bucket`, `_sum` and
+    `_count` series. Observing is a bisect and three additions; buckets are
+    only accumulated when the registry is rendered.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (last one is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        series = self._series.get(labelvalues)
+        if series is None:
+            series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def time(self, *labelvalues: str) -> _Timer:
+        return _Timer(self, labelvalues)
+
+    def count(self, *labelvalues: str) -> int:
+        series = self._series.get(labelvalues)
+        return sum(series[0]) if series is not None else 0
+
+    def render(self, const: str = "") -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        bucket_names = self.labelnames + ("le",)
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for labelvalues, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_names, labelvalues + (bound,), const)} {cumulative}")
+            labels = _format_labels(self.labelnames, labelvalues, const)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+class Registry:
+    """
+    In-process metrics, rendered in the Prometheus text exposition format.
+
+    Metrics are plain dicts updated from the event loop without locks, so each
+    uvicorn worker keeps its own series. Every series carries a `worker` label
+    (the process id by default) so a scrape landing on any worker adds to that
+    worker's series instead of appearing to reset another's; sum over `worker`
+    when querying.
+    """
+
+    def __init__(self, worker: Callable[[], str] = lambda: str(os.getpid())):
+        self._worker = worker
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        const = f'worker="{_escape(self._worker())}"'
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render(const))
+        return "\n".join(lines) + "\n"
+
+def timed(histogram: Histogram, *labelvalues: str) -> Callable:
+    """Decorates a coroutine function so every call is observed by `histogram`, errors included."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with histogram.time(*labelvalues):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+registry = Registry()
+
+HTTP_REQUEST_SECONDS = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route", "status"),
+))
+USE_CASE_SECONDS = registry.register(Histogram(
+    "use_case_duration_seconds", "Use case execution time, errors included.", ("use_case",),
+))
+DB_QUERY_SECONDS = registry.register(Histogram(
+    "db_query_duration_seconds", "Time spent executing a statement on the database.", ("engine", "statement"),
+))
+DB_POOL_WAIT_SECONDS = registry.register(Histogram(
+    "db_pool_wait_seconds", "Time spent waiting for a pooled connection.", ("engine",),
+))
+DB_POOL_TIMEOUTS = registry.register(Counter(
+    "db_pool_timeouts_total", "Checkouts that gave up after pool_timeout.", ("engine",),
+))
+UPSTREAM_SECONDS = registry.register(Histogram(
+    "upstream_request_duration_seconds", "Exchange rate provider call latency.", ("provider", "pair"),
+))
+UPSTREAM_ERRORS = registry.register(Counter(
+    "upstream_request_errors_total", "Exchange rate provider calls that failed.", ("provider", "pair"),
+))
+SWAPS = registry.register(Counter(
+    "swaps_total", "Swaps by strategy and outcome: ok once committed, rejected, or failed when the transaction rolled back.", ("strategy", "outcome"),
+))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+from infrastructure.metrics import Counter, Histogram, Registry, timed
+from infrastructure.metrics_middleware import RequestMetricsMiddleware
+
+class TestMetrics(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.registry = Registry(worker=lambda: "7")
+        self.counter = self.registry.register(Counter("swaps_total", "Swaps.", ("strategy", "outcome")))
+        self.histogram = self.registry.register(Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0)))
+
+    def test_histogram_renders_cumulative_buckets(self):
+        self.histogram.observe(0.05, "/swap")
+        self.histogram.observe(0.1, "/swap")
+        self.histogram.observe(0.5, "/swap")
+        self.histogram.observe(3, "/swap")
+
+        lines = self.registry.render().splitlines()
+
+        self.assertIn('latency_seconds_bucket{worker="7",route="/swap",le="0.1"} 2', lines)
+        self.assertIn('latency_seconds_bucket{worker="7",route="/swap",le="1.0"} 3', lines)
+        self.assertIn('latency_seconds_bucket{worker="7",route="/swap",le="+Inf"} 4', lines)
+        self.assertIn('latency_seconds_sum{worker="7",route="/swap"} 3.65', lines)
+        self.assertIn('latency_seconds_count{worker="7",route="/swap"} 4', lines)
+        self.assertIn("# TYPE latency_seconds histogram", lines)
+
+    def test_counter_and_label_escaping(self):
+        self.counter.inc("FiatToFiatStrategy", "ok")
+        self.counter.inc("FiatToFiatStrategy", "ok")
+        self.counter.inc('odd"name', "rejected")
+
+        lines = self.registry.render().splitlines()
+
+        self.assertIn('swaps_total{worker="7",strategy="FiatToFiatStrategy",outcome="ok"} 2.0', lines)
+        self.assertIn('swaps_total{worker="7",strategy="odd\\"name",outcome="rejected"} 1.0', lines)
+
+    async def test_timed_observes_failures(self):
+        @timed(self.histogram, "UseCase")
+        async def failing():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            await failing()
+
+        self.assertEqual(self.histogram.count("UseCase"), 1)
+
+class TestRequestMetricsMiddleware(unittest.TestCase):
+
+    def test_labels_by_route_template(self):
+        from infrastructure.metrics import HTTP_REQUEST_SECONDS
+
+        app = FastAPI()
+        app.add_middleware(RequestMetricsMiddleware)
+
+        @app.get("/users/{user_id}/balances")
+        async def balances(user_id: str):
+            return {}
+
+        before = HTTP_REQUEST_SECONDS.count("GET", "/users/{user_id}/balances", "200")
+        client = TestClient(app)
+        client.get("/users/a/balances")
+        client.get("/users/b/balances")
+        client.get("/nope")
+
+        self.assertEqual(HTTP_REQUEST_SECONDS.count("GET", "/users/{user_id}/balances", "200"), before + 2)
+        self.assertGreaterEqual(HTTP_REQUEST_SECONDS.count("GET", "unmatched", "404"), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,13 +6,15 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from infrastructure.psql import models
-from infrastructure.psql.db import create_tables
+from alembic import command
+from alembic.config import Config
+
+ALEMBIC_INI = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../alembic.ini'))
 
 def init_database():
     try:
-        create_tables()
-        print("✅ Tables created successfully")
+        command.upgrade(Config(ALEMBIC_INI), "head")
+        print("✅ Migrations applied successfully")
         return True
         
     except Exception as e:
@@ -25,4 +27,4 @@ if __name__ == "__main__":
         print("\n🎉 Database initialized successfully")
     else:
         print("\n💥 Error initializing database")
-        sys.exit(1) 
\ No newline at end of file
+        sys.exit(1) 
@@ -0,0 +1,36 @@
+"""Store transfer amounts as numeric(18, 8)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "transfer",
+        "amount",
+        type_=sa.Numeric(precision=18, scale=8),
+        existing_nullable=False,
+        postgresql_using="amount::numeric(18, 8)",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "transfer",
+        "amount",
+        type_=sa.String(),
+        existing_nullable=False,
+        postgresql_using="amount::text",
+    )
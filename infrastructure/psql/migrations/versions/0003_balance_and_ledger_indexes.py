@@ -0,0 +1,58 @@
+"""Index balance lookups and the transfer ledger
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+Indexes are built with CREATE INDEX CONCURRENTLY so writes keep flowing while
+they build. CONCURRENTLY cannot run inside a transaction, hence the autocommit
+block. If a build is interrupted Postgres leaves an INVALID index behind: drop
+it and run the upgrade again.
+
+The unique index on user_balance fails to build if a user already holds two
+rows for the same currency; merge those rows first.
+
+transfer(user_id, created_at, id) also serves every user_id / created_at
+lookup, so no separate (user_id, created_at) index is created.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_user_balance_user_id_currency",
+            "user_balance",
+            ["user_id", "currency"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_transfer_user_id_created_at_id",
+            "transfer",
+            ["user_id", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_transfer_reference",
+            "transfer",
+            ["reference"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_transfer_reference", table_name="transfer", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_transfer_user_id_created_at_id", table_name="transfer", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("uq_user_balance_user_id_currency", table_name="user_balance", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,117 @@
+"""Partition the transfer ledger by month on created_at
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+
+The existing table becomes the `transfer_legacy` partition, covering every row
+up to the start of next month, so no ledger rows are copied. Monthly partitions
+follow from there; infrastructure/psql/partitions.py keeps creating them ahead
+of time.
+
+Partitioned tables need the partition key in every unique index, so the
+primary key becomes (id, created_at). The new key index and the created_at
+bound that lets ATTACH skip its scan are prepared first, outside any
+transaction: the index is built CONCURRENTLY and the CHECK is added NOT VALID
+and validated separately, so writes keep flowing. The closing transaction only
+swaps the key onto the prepared index, renames the table, creates the parent
+and attaches, all catalog changes that hold their exclusive lock briefly.
+
+Downgrading copies the whole ledger back into a single table while writes to
+transfer are blocked, so run it in a maintenance window; partitions detached
+since the upgrade are not copied back.
+
+The CHECK rejects rows dated from next month onward while the upgrade runs,
+so don't start it in the last minutes of a month. If the prepare steps are
+interrupted, drop any INVALID index left behind and run the upgrade again.
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def upgrade() -> None:
+    boundary = _add_months(datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0), 1)
+
+    with op.get_context().autocommit_block():
+        op.execute("CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS transfer_legacy_pkey ON transfer (id, created_at)")
+        op.execute("ALTER TABLE transfer DROP CONSTRAINT IF EXISTS transfer_legacy_created_at_check")
+        op.execute(f"ALTER TABLE transfer ADD CONSTRAINT transfer_legacy_created_at_check CHECK (created_at < '{boundary}') NOT VALID")
+        # VALIDATE only takes SHARE UPDATE EXCLUSIVE, so inserts continue during the scan.
+        op.execute("ALTER TABLE transfer VALIDATE CONSTRAINT transfer_legacy_created_at_check")
+
+    op.execute("ALTER TABLE transfer DROP CONSTRAINT transfer_pkey")
+    op.execute("ALTER TABLE transfer ADD CONSTRAINT transfer_legacy_pkey PRIMARY KEY USING INDEX transfer_legacy_pkey")
+    op.execute("ALTER TABLE transfer RENAME TO transfer_legacy")
+    op.execute("ALTER INDEX ix_transfer_user_id_created_at_id RENAME TO transfer_legacy_user_id_created_at_id_idx")
+    op.execute("ALTER INDEX ix_transfer_reference RENAME TO transfer_legacy_reference_idx")
+
+    op.execute("""
+        CREATE TABLE transfer (
+            id UUID NOT NULL,
+            type VARCHAR NOT NULL,
+            user_id UUID NOT NULL,
+            status VARCHAR NOT NULL,
+            reference VARCHAR,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            amount NUMERIC(18, 8) NOT NULL,
+            currency VARCHAR NOT NULL,
+            CONSTRAINT transfer_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("CREATE INDEX ix_transfer_user_id_created_at_id ON transfer (user_id, created_at, id)")
+    op.execute("CREATE INDEX ix_transfer_reference ON transfer (reference)")
+
+    # The validated CHECK lets ATTACH skip its own scan; the matching indexes
+    # on transfer_legacy are adopted by the parent instead of being rebuilt.
+    op.execute(f"ALTER TABLE transfer ATTACH PARTITION transfer_legacy FOR VALUES FROM (MINVALUE) TO ('{boundary}')")
+    op.execute("ALTER TABLE transfer_legacy DROP CONSTRAINT transfer_legacy_created_at_check")
+
+    for offset in range(MONTHS_AHEAD + 1):
+        start = _add_months(boundary, offset)
+        end = _add_months(boundary, offset + 1)
+        op.execute(
+            f"CREATE TABLE transfer_y{start.year:04d}m{start.month:02d} PARTITION OF transfer "
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+
+
+def downgrade() -> None:
+    # Copies every attached partition back into one plain table. Detached
+    # partitions are no longer part of transfer and are not brought back.
+    op.execute("""
+        CREATE TABLE transfer_unpartitioned (
+            id UUID NOT NULL,
+            type VARCHAR NOT NULL,
+            user_id UUID NOT NULL,
+            status VARCHAR NOT NULL,
+            reference VARCHAR,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            amount NUMERIC(18, 8) NOT NULL,
+            currency VARCHAR NOT NULL,
+            CONSTRAINT transfer_unpartitioned_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute("""
+        INSERT INTO transfer_unpartitioned (id, type, user_id, status, reference, created_at, amount, currency)
+        SELECT id, type, user_id, status, reference, created_at, amount, currency FROM transfer
+    """)
+    # Dropping the parent drops every attached partition with it.
+    op.execute("DROP TABLE transfer")
+    op.execute("ALTER TABLE transfer_unpartitioned RENAME TO transfer")
+    op.execute("ALTER INDEX transfer_unpartitioned_pkey RENAME TO transfer_pkey")
+    op.execute("CREATE INDEX ix_transfer_user_id_created_at_id ON transfer (user_id, created_at, id)")
+    op.execute("CREATE INDEX ix_transfer_reference ON transfer (reference)")
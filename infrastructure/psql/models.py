@@ -8,11 +8,13 @@ from .db import Base
 from source.user.domain.entities.user_entity import User
 from source.user.domain.entities.user_balance.user_balance_entity import UserBalance
 from source.transfer.domain.entities.transfer_entity import Transfer
+from source.transfer.domain.entities.idempotency_record_entity import IdempotencyRecord
 
 # Export all models for easy access
 __all__ = [
     'User',
     'UserBalance',
     'Transfer',
+    'IdempotencyRecord',
     'Base'
 ]
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Monthly range partitions of the transfer ledger.
+
+    python infrastructure/psql/partitions.py ensure [--months-ahead 3]
+    python infrastructure/psql/partitions.py detach transfer_y2025m01
+
+`ensure` creates the partitions for the coming months; the API also runs it on
+startup and every TRANSFER_PARTITION_CHECK_INTERVAL seconds. `detach` removes
+an old partition from the ledger without blocking writes, after which it is a
+plain table that can be dumped and dropped.
+"""
+
+import sys
+import os
+import re
+import asyncio
+import argparse
+import logging
+from datetime import date, datetime
+from typing import List, Optional
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+TRANSFER_PARTITIONS_AHEAD = int(os.getenv("TRANSFER_PARTITIONS_AHEAD", "3"))
+TRANSFER_PARTITION_CHECK_INTERVAL = float(os.getenv("TRANSFER_PARTITION_CHECK_INTERVAL", "3600"))
+
+PARTITION_NAME = re.compile(r"^transfer_(y\d{4}m\d{2}|legacy)$")
+
+# Upper bound of the newest existing partition, e.g. "FOR VALUES FROM (...) TO ('2026-11-01 00:00:00')".
+LATEST_BOUND = text("""
+    SELECT max((regexp_match(pg_get_expr(c.relpartbound, c.oid), 'TO \\(''([^'']+)''\\)'))[1]::timestamp)
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = 'transfer'::regclass
+""")
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(month: date) -> str:
+    return f"transfer_y{month.year:04d}m{month.month:02d}"
+
+async def ensure_transfer_partitions(conn: AsyncConnection, months_ahead: int = TRANSFER_PARTITIONS_AHEAD, today: Optional[date] = None) -> List[str]:
+    """
+    Creates the monthly partitions from the current month through `months_ahead`
+    months ahead that don't exist yet, and returns their names. Concurrent
+    callers are serialized with an advisory lock.
+    """
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('transfer_partitions'))"))
+
+    current = (today or datetime.utcnow().date()).replace(day=1)
+    latest = await conn.scalar(LATEST_BOUND)
+    start = current if latest is None else max(current, latest.date())
+
+    created = []
+    while start <= add_months(current, months_ahead):
+        end = add_months(start, 1)
+        name = partition_name(start)
+        await conn.execute(text(f"CREATE TABLE {name} PARTITION OF transfer FOR VALUES FROM ('{start}') TO ('{end}')"))
+        created.append(name)
+        start = end
+    return created
+
+async def detach_transfer_partition(conn: AsyncConnection, name: str, today: Optional[date] = None) -> None:
+    """
+    Detaches a past partition with DETACH PARTITION CONCURRENTLY, which cannot
+    run inside a transaction: `conn` must be in AUTOCOMMIT mode.
+    """
+    if not PARTITION_NAME.match(name):
+        raise ValueError(f"{name} is not a transfer partition")
+    current = partition_name((today or datetime.utcnow().date()).replace(day=1))
+    if name != "transfer_legacy" and name >= current:
+        raise ValueError(f"Only past months can be detached, not {name}")
+    await conn.execute(text(f"ALTER TABLE transfer DETACH PARTITION {name} CONCURRENTLY"))
+
+async def maintain_transfer_partitions(engine: AsyncEngine, interval: float = TRANSFER_PARTITION_CHECK_INTERVAL) -> None:
+    """Background loop that keeps future partitions in place while the API runs."""
+    while True:
+        try:
+            async with engine.begin() as conn:
+                created = await ensure_transfer_partitions(conn)
+            if created:
+                logger.info(f"Created transfer partitions: {', '.join(created)}")
+        except Exception as e:
+            logger.warning(f"Transfer partition maintenance failed: {e}")
+        await asyncio.sleep(interval)
+
+async def _main(args) -> None:
+    from infrastructure.psql.db import engine
+
+    try:
+        if args.command == "ensure":
+            async with engine.begin() as conn:
+                created = await ensure_transfer_partitions(conn, args.months_ahead)
+            print(f"created: {', '.join(created) or 'none'}")
+        else:
+            async with engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await detach_transfer_partition(conn, args.partition)
+            print(f"detached {args.partition}; it can now be archived and dropped")
+    finally:
+        await engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage monthly partitions of the transfer ledger")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ensure = commands.add_parser("ensure", help="Create partitions for the coming months")
+    ensure.add_argument("--months-ahead", type=int, default=TRANSFER_PARTITIONS_AHEAD)
+    detach = commands.add_parser("detach", help="Detach a past month's partition for archival")
+    detach.add_argument("partition", help="Partition name, e.g. transfer_y2025m01")
+    asyncio.run(_main(parser.parse_args()))
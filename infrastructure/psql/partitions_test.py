@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from infrastructure.psql.partitions import add_months, detach_transfer_partition, ensure_transfer_partitions, partition_name
+
+class TestPartitions(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.conn = MagicMock()
+        self.conn.execute = AsyncMock()
+        self.conn.scalar = AsyncMock()
+
+    def _statements(self):
+        return [str(call.args[0]) for call in self.conn.execute.await_args_list]
+
+    def test_add_months_rolls_over_the_year(self):
+        self.assertEqual(add_months(date(2026, 11, 1), 3), date(2027, 2, 1))
+        self.assertEqual(partition_name(date(2027, 2, 1)), "transfer_y2027m02")
+
+    async def test_creates_only_missing_months(self):
+        self.conn.scalar.return_value = datetime(2026, 12, 1)
+
+        created = await ensure_transfer_partitions(self.conn, months_ahead=3, today=date(2026, 10, 18))
+
+        self.assertEqual(created, ["transfer_y2026m12", "transfer_y2027m01"])
+        statements = self._statements()
+        self.assertIn("pg_advisory_xact_lock", statements[0])
+        self.assertIn("FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')", statements[1])
+
+    async def test_nothing_to_create_when_months_exist(self):
+        self.conn.scalar.return_value = datetime(2027, 6, 1)
+
+        self.assertEqual(await ensure_transfer_partitions(self.conn, months_ahead=3, today=date(2026, 10, 18)), [])
+
+    async def test_detaches_past_partition_concurrently(self):
+        await detach_transfer_partition(self.conn, "transfer_y2025m01", today=date(2026, 10, 18))
+
+        self.assertIn("DETACH PARTITION transfer_y2025m01 CONCURRENTLY", self._statements()[0])
+
+    async def test_refuses_current_or_unknown_partitions(self):
+        with self.assertRaises(ValueError):
+            await detach_transfer_partition(self.conn, "transfer_y2026m10", today=date(2026, 10, 18))
+        with self.assertRaises(ValueError):
+            await detach_transfer_partition(self.conn, "users; DROP TABLE transfer")
+
+        self.conn.execute.assert_not_awaited()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from infrastructure.psql.pool import TimedQueuePool
+
+class TestTimedQueuePool(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.pool = TimedQueuePool(creator=MagicMock, pool_size=1, max_overflow=0, timeout=0.05)
+
+    async def test_counts_checkouts(self):
+        connection = await greenlet_spawn(self.pool.connect)
+
+        stats = self.pool.stats()
+        self.assertEqual(stats["checkouts"], 1)
+        self.assertEqual(stats["checked_out"], 1)
+
+        connection.close()
+        self.assertEqual(self.pool.stats()["checked_in"], 1)
+
+    async def test_records_timeout_when_exhausted(self):
+        connection = await greenlet_spawn(self.pool.connect)
+
+        with self.assertRaises(exc.TimeoutError):
+            await greenlet_spawn(self.pool.connect)
+
+        self.assertEqual(self.pool.stats()["timeouts"], 1)
+        connection.close()
+
+    async def test_records_wait_for_released_connection(self):
+        pool = TimedQueuePool(creator=MagicMock, pool_size=1, max_overflow=0, timeout=1)
+        connection = await greenlet_spawn(pool.connect)
+
+        waiter = asyncio.create_task(greenlet_spawn(pool.connect))
+        await asyncio.sleep(0.05)
+        connection.close()
+        (await waiter).close()
+
+        stats = pool.stats()
+        self.assertEqual(stats["checkouts"], 2)
+        self.assertGreaterEqual(stats["wait_max_ms"], 40)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Optional, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from infrastructure.psql import db
+
+# Reads for a user stay on the primary for this many seconds after their own write; keep it above the replica lag.
+REPLICA_LAG_GUARD = float(os.getenv("DB_REPLICA_LAG_GUARD", "5"))
+REPLICA_RECENT_WRITES = int(os.getenv("DB_REPLICA_RECENT_WRITES", "100000"))
+
+class RecentWrites:
+    """
+    Remembers when each user last committed a write, so their reads can skip
+    the replica until it has had `guard` seconds to catch up.
+
+    Tracking is per process: a write served by one worker is not seen by the
+    others, which is why the guard should be generous rather than tight.
+    Oldest entries are evicted past `max_entries`; an evicted user is just
+    read from the replica again.
+    """
+
+    def __init__(self, guard: float, max_entries: int, clock: Callable[[], float] = time.monotonic):
+        self.guard = guard
+        self.max_entries = max_entries
+        self._clock = clock
+        self._written_at: "OrderedDict[str, float]" = OrderedDict()
+
+    def record(self, user_id: str) -> None:
+        user_id = str(user_id)
+        self._written_at[user_id] = self._clock()
+        self._written_at.move_to_end(user_id)
+        while len(self._written_at) > self.max_entries:
+            self._written_at.popitem(last=False)
+
+    def wrote_recently(self, user_id: str) -> bool:
+        written_at = self._written_at.get(str(user_id))
+        if written_at is None:
+            return False
+        if self._clock() - written_at < self.guard:
+            return True
+        del self._written_at[str(user_id)]
+        return False
+
+recent_writes = RecentWrites(guard=REPLICA_LAG_GUARD, max_entries=REPLICA_RECENT_WRITES)
+
+def read_session_factory(user_id: Union[str, uuid.UUID]) -> Callable[[], AsyncSession]:
+    """Replica sessions for read-only use cases, unless there is no replica or `user_id` just wrote."""
+    replica: Optional[Callable[[], AsyncSession]] = db.ReplicaSessionLocal
+    if replica is None or recent_writes.wrote_recently(str(user_id)):
+        return db.AsyncSessionLocal
+    return replica
+
+async def get_read_db(user_id: str):
+    """Like `get_db`, but for routes that only read one user's data. Nothing is ever committed."""
+    async with read_session_factory(user_id)() as session:
+        yield session
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from infrastructure.psql import db
+from infrastructure.psql.replica import RecentWrites, read_session_factory
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestRecentWrites(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.writes = RecentWrites(guard=5, max_entries=2, clock=self.clock)
+
+    def test_guard_window(self):
+        self.writes.record("u1")
+
+        self.clock.now = 4.9
+        self.assertTrue(self.writes.wrote_recently("u1"))
+        self.clock.now = 5
+        self.assertFalse(self.writes.wrote_recently("u1"))
+        self.assertFalse(self.writes.wrote_recently("u2"))
+
+    def test_evicts_oldest_writer(self):
+        self.writes.record("u1")
+        self.writes.record("u2")
+        self.writes.record("u1")
+        self.writes.record("u3")
+
+        self.assertTrue(self.writes.wrote_recently("u1"))
+        self.assertFalse(self.writes.wrote_recently("u2"))
+        self.assertTrue(self.writes.wrote_recently("u3"))
+
+class TestReadSessionFactory(unittest.TestCase):
+
+    def setUp(self):
+        self.replica = object()
+        self.writes = RecentWrites(guard=5, max_entries=10)
+
+    def test_primary_without_replica(self):
+        with patch.object(db, "ReplicaSessionLocal", None):
+            self.assertIs(read_session_factory("u1"), db.AsyncSessionLocal)
+
+    def test_replica_unless_user_just_wrote(self):
+        with patch.object(db, "ReplicaSessionLocal", self.replica), \
+                patch("infrastructure.psql.replica.recent_writes", self.writes):
+            self.assertIs(read_session_factory("u1"), self.replica)
+
+            self.writes.record("u1")
+            self.assertIs(read_session_factory("u1"), db.AsyncSessionLocal)
+            self.assertIs(read_session_factory("u2"), self.replica)
+
+if __name__ == "__main__":
+    unittest.main()
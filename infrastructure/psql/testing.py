@@ -0,0 +1,30 @@
+"""
+Fakes for unit tests that check the SQL a use case builds without a database.
+
+Queue what `execute` returns with `db.execute.side_effect = [fake_result(...), ...]`
+and compile the awaited statements with `compiled_sql` to assert on them.
+"""
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+# Imports every entity so relationships between mappers resolve in isolated test runs.
+from infrastructure.psql import models  # noqa: F401
+
+def fake_session() -> MagicMock:
+    db = MagicMock()
+    db.execute = AsyncMock()
+    db.commit = AsyncMock()
+    db.rollback = AsyncMock()
+    db.close = AsyncMock()
+    db.info = {}
+    return db
+
+def fake_result(rows) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+def compiled_sql(call, literal_binds: bool = False) -> str:
+    """Renders the statement passed to an awaited `execute` call as PostgreSQL."""
+    compile_kwargs = {"literal_binds": True} if literal_binds else {}
+    return str(call.args[0].compile(dialect=postgresql.dialect(), compile_kwargs=compile_kwargs))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from infrastructure.psql.db import UnitOfWork, after_commit, after_rollback
+
+class TestUnitOfWork(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.session = MagicMock()
+        self.session.commit = AsyncMock()
+        self.session.rollback = AsyncMock()
+        self.session.close = AsyncMock()
+        self.session.info = {}
+        self.uow = UnitOfWork(session_factory=lambda: self.session)
+
+    async def test_commits_once_on_success(self):
+        async with self.uow as uow:
+            uow.session.add(object())
+
+        self.session.commit.assert_awaited_once()
+        self.session.rollback.assert_not_awaited()
+        self.session.close.assert_awaited_once()
+
+    async def test_rolls_back_on_error(self):
+        with self.assertRaises(ValueError):
+            async with self.uow:
+                raise ValueError("Insufficient balance.")
+
+        self.session.commit.assert_not_awaited()
+        self.session.rollback.assert_awaited_once()
+        self.session.close.assert_awaited_once()
+
+    async def test_closes_session_when_commit_fails(self):
+        self.session.commit.side_effect = RuntimeError("connection lost")
+
+        with self.assertRaises(RuntimeError):
+            async with self.uow:
+                pass
+
+        self.session.close.assert_awaited_once()
+
+    async def test_runs_after_commit_callbacks_only_once_committed(self):
+        calls = []
+
+        async with self.uow as uow:
+            after_commit(uow.session, lambda: calls.append("cached"))
+            self.assertEqual(calls, [])
+
+        self.assertEqual(calls, ["cached"])
+
+    async def test_drops_after_commit_callbacks_on_rollback(self):
+        calls = []
+
+        with self.assertRaises(ValueError):
+            async with self.uow as uow:
+                after_commit(uow.session, lambda: calls.append("cached"))
+                raise ValueError("Insufficient balance.")
+
+        self.assertEqual(calls, [])
+        self.assertEqual(self.session.info, {})
+
+    async def test_runs_after_rollback_callbacks_when_commit_fails(self):
+        self.session.commit.side_effect = RuntimeError("connection lost")
+        calls = []
+
+        with self.assertRaises(RuntimeError):
+            async with self.uow as uow:
+                after_commit(uow.session, lambda: calls.append("committed"))
+                after_rollback(uow.session, lambda: calls.append("released"))
+
+        self.assertEqual(calls, ["released"])
+        self.assertEqual(self.session.info, {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,58 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from infrastructure.metrics import CONTENT_TYPE, registry
+from infrastructure.metrics_middleware import RequestMetricsMiddleware
+from infrastructure.psql.db import engine, pool_stats
+from infrastructure.psql.partitions import maintain_transfer_partitions
+from source.transfer.application.use_cases.deposit.group_commit import deposit_committer
+from source.transfer.application.use_cases.swap.mailbox import swap_mailbox
 from source.user.application.router import router as user_router
 from source.transfer.application.router import router as transfer_router
+from source.transfer.infrastructure.service.price_provider import PriceProvider
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await PriceProvider.start()
+    PriceProvider.start_refresher()
+    partitions = asyncio.create_task(maintain_transfer_partitions(engine))
+    try:
+        yield
+    finally:
+        await deposit_committer.close()
+        await swap_mailbox.close()
+        partitions.cancel()
+        try:
+            await partitions
+        except asyncio.CancelledError:
+            pass
+        await PriceProvider.stop_refresher()
+        await PriceProvider.close()
 
 app = FastAPI(
     title="Simple Swap API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+app.add_middleware(RequestMetricsMiddleware)
+
 app.include_router(user_router)
 app.include_router(transfer_router)
 
 @app.get("/health")
 async def health_check():
-    return { "status": "healthy" }
\ No newline at end of file
+    return { "status": "healthy" }
+
+@app.get("/health/rates")
+async def rate_stats():
+    return PriceProvider.rate_stats()
+
+@app.get("/health/db-pool")
+async def db_pool_stats():
+    return pool_stats()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
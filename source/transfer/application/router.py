@@ -1,9 +1,19 @@
 from fastapi import APIRouter
 from source.transfer.application.use_cases.deposit.controller import deposit
+from source.transfer.application.use_cases.deposit_batch.controller import deposit_batch
 from source.transfer.application.use_cases.history.controller import history
+from source.transfer.application.use_cases.history_export.controller import history_export
+from source.transfer.application.use_cases.quote.controller import quote
+from source.transfer.application.use_cases.statement.controller import statement
 from source.transfer.application.use_cases.swap.controller import swap
+from source.transfer.application.use_cases.swap_batch.controller import swap_batch
 
 router = APIRouter(prefix="", tags=["transfer"])
+router.add_api_route("/quote", quote, methods=["POST"])
 router.add_api_route("/swap", swap, methods=["POST"])
+router.add_api_route("/swaps/batch", swap_batch, methods=["POST"])
 router.add_api_route("/deposit", deposit, methods=["POST"])
-router.add_api_route("/user/{user_id}/history", history, methods=["GET"])
\ No newline at end of file
+router.add_api_route("/deposits/batch", deposit_batch, methods=["POST"])
+router.add_api_route("/user/{user_id}/history", history, methods=["GET"])
+router.add_api_route("/user/{user_id}/history/export", history_export, methods=["GET"])
+router.add_api_route("/user/{user_id}/statement", statement, methods=["GET"])
\ No newline at end of file
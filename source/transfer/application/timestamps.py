@@ -0,0 +1,7 @@
+from datetime import datetime, timezone
+
+def as_naive_utc(value: datetime) -> datetime:
+    """Transfer.created_at is stored as a naive UTC timestamp."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -1,6 +1,7 @@
 from decimal import Decimal
 import uuid
-from fastapi import HTTPException, Depends
+from typing import Optional
+from fastapi import HTTPException, Depends, Header
 from pydantic import BaseModel
 from source.common_types.currency_types import CurrencyType
 from source.common_types.transfer_operation_types import TransferOperationType
@@ -8,6 +9,8 @@ from source.common_types.transfer_status_types import TransferStatusType
 from sqlalchemy.ext.asyncio import AsyncSession
 from infrastructure.psql.db import get_db
 from source.transfer.application.use_cases.deposit.use_case import DepositUseCase
+from source.transfer.application.use_cases.deposit.group_commit import DEPOSIT_GROUP_COMMIT, deposit_committer
+from source.transfer.infrastructure.idempotency import idempotency
 
 class DepositResponse(BaseModel):
     id: str
@@ -23,14 +26,34 @@ class DepositRequest(BaseModel):
 
 async def deposit(
     request: DepositRequest,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    idempotency_key: Optional[str] = Header(None, max_length=255)
 ):
+    if DEPOSIT_GROUP_COMMIT and idempotency_key is None:
+        # The deposit commits with others queued in the same few milliseconds;
+        # keyed requests stay on the regular path so the key commits atomically with it.
+        result = await deposit_committer.submit({"user_id": request.user_id, "amount": request.amount, "currency": request.currency})
+        if not result.accepted:
+            raise HTTPException(status_code=400, detail=result.error)
+        return _response(result.transfer)
+
+    payload = request.model_dump(mode="json")
     use_case = DepositUseCase(db)
     try:
+        if idempotency_key is not None:
+            stored = await idempotency.claim(db, "deposit", idempotency_key, payload)
+            if stored is not None:
+                return stored
         transaction = await use_case.execute(user_id=request.user_id, amount=request.amount, currency=request.currency)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    response = _response(transaction)
+    if idempotency_key is not None:
+        await idempotency.save(db, "deposit", idempotency_key, payload, response.model_dump(mode="json"))
+    return response
+
+def _response(transaction) -> DepositResponse:
     return DepositResponse(
         id=str(transaction.id),
         type=TransferOperationType.DEPOSIT.value,
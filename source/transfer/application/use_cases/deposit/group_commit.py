@@ -0,0 +1,22 @@
+import os
+from typing import Dict, List
+from dotenv import load_dotenv
+from infrastructure.psql.db import UnitOfWork
+from source.transfer.application.use_cases.deposit_batch.deposit_batch_result import DepositBatchResult
+from source.transfer.application.use_cases.deposit_batch.use_case import DepositBatchUseCase
+from source.transfer.infrastructure.group_commit import GroupCommitter
+
+load_dotenv()
+
+DEPOSIT_GROUP_COMMIT = os.getenv("DEPOSIT_GROUP_COMMIT", "false").lower() == "true"
+
+async def apply_deposits(deposits: List[Dict]) -> List[DepositBatchResult]:
+    # Results are returned only after the unit of work has committed.
+    async with UnitOfWork() as uow:
+        return await DepositBatchUseCase(uow.session).execute(deposits)
+
+deposit_committer = GroupCommitter(
+    apply_deposits,
+    max_batch=int(os.getenv("DEPOSIT_GROUP_COMMIT_MAX_BATCH", "500")),
+    max_delay=float(os.getenv("DEPOSIT_GROUP_COMMIT_MAX_DELAY_MS", "5")) / 1000,
+)
@@ -1,31 +1,25 @@
+from decimal import Decimal
 from typing import Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from datetime import datetime
-from source.user.domain.entities.user_entity import User
-from source.user.domain.entities.user_balance.user_balance_entity import UserBalance
+from source.user.infrastructure.balance_mutations import apply_balance_changes
 from source.transfer.domain.entities.transfer_entity import Transfer
+from source.transfer.infrastructure.ledger import insert_transfers
 from source.common_types.transfer_operation_types import TransferOperationType
 from source.common_types.transfer_status_types import TransferStatusType
+from infrastructure.metrics import USE_CASE_SECONDS, timed
 
 class DepositUseCase:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @timed(USE_CASE_SECONDS, "DepositUseCase")
     async def execute(self, user_id: str, amount: float, currency: str) -> Transfer:
-        result = await self.db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
-        if not user:
-            raise ValueError('User not found')
+        amount_decimal = Decimal(str(amount))
+        if amount_decimal <= 0:
+            raise ValueError("Amount must be positive")
 
-
-        result = await self.db.execute(
-            select(UserBalance).where(UserBalance.user_id == user_id, UserBalance.currency == currency)
-        )
-        balance = result.scalar_one_or_none()
-        if not balance:
-            raise ValueError('Balance for currency not found')
-        balance.increment(str(amount))
+        await apply_balance_changes(self.db, user_id, {currency: amount_decimal})
 
         transfer = Transfer(
             type=TransferOperationType.DEPOSIT.value,
@@ -33,13 +27,10 @@ class DepositUseCase:
             status=TransferStatusType.CONFIRMED.value,
             reference=None,
             created_at=datetime.utcnow(),
-            amount=str(amount),
+            amount=amount_decimal,
             currency=currency
         )
         
-        self.db.add(transfer)
-        self.db.add(balance)
-        await self.db.commit()
-        await self.db.refresh(transfer)
+        await insert_transfers(self.db, [transfer])
 
-        return transfer
\ No newline at end of file
+        return transfer
@@ -0,0 +1,55 @@
+import os
+import uuid
+from decimal import Decimal
+from typing import List, Optional
+from fastapi import Depends
+from pydantic import BaseModel, Field
+from source.common_types.currency_types import CurrencyType
+from source.common_types.transfer_status_types import TransferStatusType
+from sqlalchemy.ext.asyncio import AsyncSession
+from infrastructure.psql.db import get_db
+from source.transfer.application.use_cases.deposit_batch.use_case import DepositBatchUseCase
+
+DEPOSIT_BATCH_MAX_SIZE = int(os.getenv("DEPOSIT_BATCH_MAX_SIZE", "1000"))
+
+class DepositBatchItem(BaseModel):
+    user_id: uuid.UUID
+    amount: Decimal
+    currency: CurrencyType
+
+class DepositBatchRequest(BaseModel):
+    deposits: List[DepositBatchItem] = Field(min_length=1, max_length=DEPOSIT_BATCH_MAX_SIZE)
+
+class DepositBatchItemResponse(BaseModel):
+    index: int
+    status: TransferStatusType
+    id: Optional[str] = None
+    created_at: Optional[str] = None
+    error: Optional[str] = None
+
+class DepositBatchResponse(BaseModel):
+    accepted: int
+    rejected: int
+    results: List[DepositBatchItemResponse]
+
+async def deposit_batch(
+    request: DepositBatchRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    use_case = DepositBatchUseCase(db)
+    results = await use_case.execute([deposit.model_dump() for deposit in request.deposits])
+
+    items = [
+        DepositBatchItemResponse(
+            index=result.index,
+            status=result.transfer.status,
+            id=str(result.transfer.id),
+            created_at=result.transfer.created_at.isoformat(),
+        )
+        if result.accepted else
+        DepositBatchItemResponse(index=result.index, status=TransferStatusType.FAILED, error=result.error)
+        for result in results
+    ]
+    accepted = sum(1 for result in results if result.accepted)
+
+    return DepositBatchResponse(accepted=accepted, rejected=len(results) - accepted, results=items)
@@ -0,0 +1,12 @@
+from typing import Optional
+from source.transfer.domain.entities.transfer_entity import Transfer
+
+class DepositBatchResult:
+    def __init__(self, index: int, transfer: Optional[Transfer] = None, error: Optional[str] = None):
+        self.index = index
+        self.transfer = transfer
+        self.error = error
+
+    @property
+    def accepted(self) -> bool:
+        return self.transfer is not None
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+import uuid
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../')))
+
+from sqlalchemy.dialects import postgresql
+from infrastructure.psql.testing import compiled_sql, fake_result, fake_session
+from source.transfer.application.use_cases.deposit_batch.use_case import DepositBatchUseCase
+
+class TestDepositBatchUseCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.alice = uuid.uuid4()
+        self.bob = uuid.uuid4()
+        self.db = fake_session()
+        self.use_case = DepositBatchUseCase(self.db)
+
+    async def test_locks_then_aggregates_increments_into_one_update_and_one_insert(self):
+        self.db.execute.side_effect = [
+            fake_result([(self.alice, "USD", Decimal("0")), (self.bob, "ARS", Decimal("0"))]),
+            fake_result([(self.alice, "USD"), (self.bob, "ARS")]),
+            fake_result([]),
+        ]
+
+        results = await self.use_case.execute([
+            {"user_id": self.alice, "amount": Decimal("10"), "currency": "USD"},
+            {"user_id": self.alice, "amount": Decimal("5"), "currency": "USD"},
+            {"user_id": self.bob, "amount": Decimal("100"), "currency": "ARS"},
+        ])
+
+        self.assertTrue(all(result.accepted for result in results))
+        self.assertEqual(self.db.execute.await_count, 3)
+
+        lock_call, update_call, insert_call = self.db.execute.await_args_list
+        self.assertIn("FOR UPDATE", compiled_sql(lock_call))
+        self.assertTrue(compiled_sql(update_call).startswith("UPDATE user_balance"))
+        increments = update_call.args[0].compile(dialect=postgresql.dialect()).params
+        self.assertIn(Decimal("15"), increments.values())
+
+        self.assertTrue(compiled_sql(insert_call).startswith("INSERT INTO transfer"))
+        rows = insert_call.args[1]
+        self.assertEqual([row["amount"] for row in rows], [Decimal("10"), Decimal("5"), Decimal("100")])
+
+    async def test_rejects_invalid_items_and_keeps_the_rest(self):
+        stranger = uuid.uuid4()
+        self.db.execute.side_effect = [
+            fake_result([(self.alice, "USD", Decimal("0"))]),
+            fake_result([(self.alice, "USD")]),
+            fake_result([self.bob]),
+            fake_result([]),
+        ]
+
+        results = await self.use_case.execute([
+            {"user_id": self.alice, "amount": Decimal("10"), "currency": "USD"},
+            {"user_id": self.alice, "amount": Decimal("-1"), "currency": "USD"},
+            {"user_id": self.bob, "amount": Decimal("1"), "currency": "BTC"},
+            {"user_id": stranger, "amount": Decimal("1"), "currency": "USD"},
+        ])
+
+        self.assertTrue(results[0].accepted)
+        self.assertEqual(results[1].error, "Amount must be positive")
+        self.assertEqual(results[2].error, "Balance for BTC not found")
+        self.assertEqual(results[3].error, "User not found")
+        self.assertEqual(len(self.db.execute.await_args_list[-1].args[1]), 1)
+
+if __name__ == "__main__":
+    unittest.main()
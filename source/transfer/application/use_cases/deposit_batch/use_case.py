@@ -0,0 +1,68 @@
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from source.common_types.currency_types import CurrencyType
+from source.common_types.transfer_operation_types import TransferOperationType
+from source.common_types.transfer_status_types import TransferStatusType
+from source.transfer.application.use_cases.deposit_batch.deposit_batch_result import DepositBatchResult
+from source.transfer.domain.entities.transfer_entity import Transfer
+from source.transfer.infrastructure.ledger import insert_transfers
+from source.user.infrastructure.balance_mutations import apply_balance_increments, describe_missing_balances, lock_balances
+from infrastructure.metrics import USE_CASE_SECONDS, timed
+
+class DepositBatchUseCase:
+    """
+    Applies many deposits in one transaction with a fixed number of statements,
+    regardless of batch size: one SELECT ... FOR UPDATE locking every touched
+    balance in a fixed order, so overlapping batches cannot deadlock, then one
+    UPDATE for every balance increment and one INSERT for every ledger row.
+
+    Each deposit is judged on its own: invalid amounts and unknown balances are
+    rejected, while the rest of the batch still goes through.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @timed(USE_CASE_SECONDS, "DepositBatchUseCase")
+    async def execute(self, deposits: List[Dict]) -> List[DepositBatchResult]:
+        results: List[DepositBatchResult] = [None] * len(deposits)
+        increments: Dict[Tuple[str, str], Decimal] = defaultdict(Decimal)
+        pending = []
+
+        for index, deposit in enumerate(deposits):
+            amount = Decimal(str(deposit["amount"]))
+            if amount <= 0:
+                results[index] = DepositBatchResult(index, error="Amount must be positive")
+                continue
+            key = (str(deposit["user_id"]), CurrencyType(deposit["currency"]).value)
+            increments[key] += amount
+            pending.append((index, key, amount))
+
+        await lock_balances(self.db, increments.keys())
+        applied = await apply_balance_increments(self.db, increments)
+        errors = await describe_missing_balances(self.db, [key for key in increments if key not in applied])
+
+        created_at = datetime.utcnow()
+        transfers = []
+        for index, (user_id, currency), amount in pending:
+            if (user_id, currency) in errors:
+                results[index] = DepositBatchResult(index, error=errors[(user_id, currency)])
+                continue
+            transfer = Transfer(
+                type=TransferOperationType.DEPOSIT.value,
+                user_id=user_id,
+                status=TransferStatusType.CONFIRMED.value,
+                reference=None,
+                created_at=created_at,
+                amount=amount,
+                currency=currency
+            )
+            transfers.append(transfer)
+            results[index] = DepositBatchResult(index, transfer=transfer)
+
+        await insert_transfers(self.db, transfers)
+
+        return results
@@ -1,20 +1,39 @@
-from fastapi import HTTPException, Depends
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException, Depends, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from infrastructure.psql.db import get_db
+from infrastructure.psql.replica import get_read_db
+from source.common_types.currency_types import CurrencyType
+from source.common_types.transfer_operation_types import TransferOperationType
 from source.transfer.application.use_cases.history.use_case import HistoryUseCase
 from source.transfer.domain.entities.transfer_entity import Transfer
 
 class HistoryResponse(BaseModel):
     transactions: list[dict]
+    next_cursor: Optional[str] = None
 
 async def history(
     user_id: str,
-    db: AsyncSession = Depends(get_db)
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    type: Optional[TransferOperationType] = None,
+    currency: Optional[CurrencyType] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
     use_case = HistoryUseCase(db)
     try:
-        transactions = await use_case.execute(user_id=user_id)
+        transactions, next_cursor = await use_case.execute(
+            user_id=user_id,
+            limit=limit,
+            cursor=cursor,
+            type=type.value if type else None,
+            currency=currency.value if currency else None,
+            start=start,
+            end=end,
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -25,5 +44,6 @@ async def history(
             "user_id": str(t.user_id),
             "status": t.status,
             "created_at": t.created_at.isoformat() if t.created_at else None
-        } for t in transactions]
+        } for t in transactions],
+        next_cursor=next_cursor,
     )
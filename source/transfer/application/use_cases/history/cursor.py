@@ -0,0 +1,16 @@
+import base64
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+def encode_cursor(created_at: datetime, transfer_id: uuid.UUID) -> str:
+    raw = f"{created_at.isoformat()}|{transfer_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, transfer_id = raw.split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(transfer_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
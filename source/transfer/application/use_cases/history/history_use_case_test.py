@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../')))
+
+from sqlalchemy.dialects import postgresql
+from source.transfer.application.use_cases.history.use_case import HistoryUseCase
+from source.transfer.application.use_cases.history.cursor import encode_cursor, decode_cursor
+from source.transfer.domain.entities.transfer_entity import Transfer
+
+class TestHistoryUseCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.user_id = str(uuid.uuid4())
+        self.db = MagicMock()
+        self.db.execute = AsyncMock()
+        self.use_case = HistoryUseCase(self.db)
+
+    def _transfers(self, count: int):
+        now = datetime(2024, 1, 15, 12, 0, 0)
+        transfers = []
+        for i in range(count):
+            transfer = Transfer(type="DEPOSIT", user_id=self.user_id, status="CONFIRMED", created_at=now - timedelta(minutes=i), amount="1", currency="USD")
+            transfers.append(transfer)
+        return transfers
+
+    def _returns(self, transfers):
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = transfers
+        self.db.execute.return_value = result
+
+    def _sql(self) -> str:
+        statement = self.db.execute.await_args.args[0]
+        return str(statement.compile(dialect=postgresql.dialect()))
+
+    async def test_returns_page_and_next_cursor(self):
+        transfers = self._transfers(3)
+        self._returns(transfers)
+
+        page, next_cursor = await self.use_case.execute(self.user_id, limit=2)
+
+        self.assertEqual(page, transfers[:2])
+        self.assertEqual(decode_cursor(next_cursor), (transfers[1].created_at, transfers[1].id))
+        sql = self._sql()
+        self.assertIn("ORDER BY transfer.created_at DESC, transfer.id DESC", sql)
+        self.assertIn("LIMIT", sql)
+
+    async def test_last_page_has_no_cursor(self):
+        self._returns(self._transfers(2))
+
+        page, next_cursor = await self.use_case.execute(self.user_id, limit=2)
+
+        self.assertEqual(len(page), 2)
+        self.assertIsNone(next_cursor)
+
+    async def test_cursor_and_filters_are_applied(self):
+        self._returns([])
+        cursor = encode_cursor(datetime(2024, 1, 15), uuid.uuid4())
+
+        await self.use_case.execute(
+            self.user_id,
+            cursor=cursor,
+            type="SWAP",
+            currency="BTC",
+            start=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end=datetime(2024, 2, 1),
+        )
+
+        sql = self._sql()
+        self.assertIn("(transfer.created_at, transfer.id) < (", sql)
+        self.assertIn("transfer.type = ", sql)
+        self.assertIn("transfer.currency = ", sql)
+        self.assertIn("transfer.created_at >= ", sql)
+        self.assertIn("transfer.created_at < ", sql)
+
+    async def test_invalid_cursor(self):
+        with self.assertRaises(ValueError) as context:
+            await self.use_case.execute(self.user_id, cursor="not-a-cursor")
+
+        self.assertEqual(str(context.exception), "Invalid cursor")
+        self.db.execute.assert_not_awaited()
+
+if __name__ == "__main__":
+    unittest.main()
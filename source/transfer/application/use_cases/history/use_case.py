@@ -1,17 +1,60 @@
-from typing import Dict
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from datetime import datetime
-from source.user.domain.entities.user_entity import User
-from source.user.domain.entities.user_balance.user_balance_entity import UserBalance
+from typing import List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, tuple_
 from source.transfer.domain.entities.transfer_entity import Transfer
-from source.common_types.transfer_operation_types import TransferOperationType
-from source.common_types.transfer_status_types import TransferStatusType
+from source.transfer.application.use_cases.history.cursor import decode_cursor, encode_cursor
+from source.transfer.application.timestamps import as_naive_utc
+from infrastructure.metrics import USE_CASE_SECONDS, timed
 
 class HistoryUseCase:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def execute(self, user_id: str) -> list[Transfer]:
-        result = await self.db.execute(select(Transfer).where(Transfer.user_id == user_id))
-        return result.scalars().all()
\ No newline at end of file
+    @timed(USE_CASE_SECONDS, "HistoryUseCase")
+    async def execute(
+        self,
+        user_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        type: Optional[str] = None,
+        currency: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Tuple[List[Transfer], Optional[str]]:
+        # Newest first, keyed on (created_at, id) so each page is an index range
+        # scan on ix_transfer_user_id_created_at_id instead of an OFFSET.
+        query = (
+            select(Transfer)
+            .where(Transfer.user_id == user_id)
+            .order_by(Transfer.created_at.desc(), Transfer.id.desc())
+            .limit(limit + 1)
+        )
+
+        if cursor is not None:
+            created_at, transfer_id = decode_cursor(cursor)
+            # The plain created_at bound is redundant with the row comparison but,
+            # unlike it, lets the planner prune monthly partitions past the cursor.
+            query = query.where(
+                Transfer.created_at <= created_at,
+                tuple_(Transfer.created_at, Transfer.id) < tuple_(created_at, transfer_id),
+            )
+        if type is not None:
+            query = query.where(Transfer.type == type)
+        if currency is not None:
+            query = query.where(Transfer.currency == currency)
+        if start is not None:
+            query = query.where(Transfer.created_at >= as_naive_utc(start))
+        if end is not None:
+            query = query.where(Transfer.created_at < as_naive_utc(end))
+
+        result = await self.db.execute(query)
+        transfers = list(result.scalars().all())
+
+        next_cursor = None
+        if len(transfers) > limit:
+            transfers = transfers[:limit]
+            last = transfers[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        return transfers, next_cursor
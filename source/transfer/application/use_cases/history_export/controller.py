@@ -0,0 +1,63 @@
+import csv
+import io
+import json
+import uuid
+from enum import Enum
+from typing import AsyncIterator
+from fastapi.responses import StreamingResponse
+from infrastructure.psql.replica import read_session_factory
+from source.transfer.application.use_cases.history_export.use_case import EXPORT_FIELDS, HistoryExportUseCase
+
+CHUNK_ROWS = 500
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+async def history_export(user_id: uuid.UUID, format: ExportFormat = ExportFormat.NDJSON):
+    return StreamingResponse(
+        _export(str(user_id), format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="history-{user_id}.{format.value}"'},
+    )
+
+async def _export(user_id: str, format: ExportFormat) -> AsyncIterator[str]:
+    # The session lives inside the generator: request dependencies are torn
+    # down before the body is streamed.
+    async with read_session_factory(user_id)() as session:
+        rows = HistoryExportUseCase(session).execute(user_id=user_id)
+        if format == ExportFormat.CSV:
+            chunks = _csv_chunks(rows)
+        else:
+            chunks = _ndjson_chunks(rows)
+        async for chunk in chunks:
+            yield chunk
+
+async def _ndjson_chunks(rows: AsyncIterator[dict]) -> AsyncIterator[str]:
+    lines = []
+    async for row in rows:
+        lines.append(json.dumps(row) + "\n")
+        if len(lines) >= CHUNK_ROWS:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+async def _csv_chunks(rows: AsyncIterator[dict]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    count = 0
+    async for row in rows:
+        writer.writerow(row)
+        count += 1
+        if count % CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import csv
+import io
+import json
+import unittest
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../')))
+
+from source.transfer.application.use_cases.history_export import controller
+from source.transfer.application.use_cases.history_export.use_case import HistoryExportUseCase
+from source.transfer.domain.entities.transfer_entity import Transfer
+
+class AsyncRows:
+    def __init__(self, items):
+        self._items = list(items)
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for item in self._items:
+            yield item
+
+class TestHistoryExport(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.user_id = str(uuid.uuid4())
+        self.transfers = [
+            Transfer(type="DEPOSIT", user_id=self.user_id, status="CONFIRMED", created_at=datetime(2024, 1, 15, 10, i), amount=str(i), currency="USD")
+            for i in range(5)
+        ]
+
+    async def _rows(self):
+        db = MagicMock()
+        stream_result = MagicMock()
+        stream_result.scalars.return_value = AsyncRows(self.transfers)
+        db.stream = AsyncMock(return_value=stream_result)
+
+        rows = [row async for row in HistoryExportUseCase(db).execute(self.user_id)]
+        options = db.stream.await_args.args[0].get_execution_options()
+        self.assertEqual(options["yield_per"], 1000)
+        return rows
+
+    async def _collect(self, chunks):
+        return [chunk async for chunk in chunks]
+
+    async def test_ndjson_export(self):
+        rows = await self._rows()
+
+        with patch.object(controller, "CHUNK_ROWS", 2):
+            chunks = await self._collect(controller._ndjson_chunks(AsyncRows(rows)))
+
+        self.assertEqual(len(chunks), 3)
+        lines = "".join(chunks).splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(json.loads(lines[0])["id"], str(self.transfers[0].id))
+
+    async def test_csv_export(self):
+        rows = await self._rows()
+
+        with patch.object(controller, "CHUNK_ROWS", 2):
+            chunks = await self._collect(controller._csv_chunks(AsyncRows(rows)))
+
+        parsed = list(csv.DictReader(io.StringIO("".join(chunks))))
+        self.assertEqual(len(parsed), 5)
+        self.assertEqual(parsed[4]["amount"], "4")
+        self.assertEqual(parsed[0]["created_at"], "2024-01-15T10:00:00")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+from typing import AsyncIterator
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from source.transfer.domain.entities.transfer_entity import Transfer
+
+EXPORT_FIELDS = ["id", "type", "user_id", "status", "reference", "created_at", "amount", "currency"]
+
+class HistoryExportUseCase:
+    def __init__(self, db: AsyncSession, batch_size: int = 1000):
+        self.db = db
+        self.batch_size = batch_size
+
+    async def execute(self, user_id: str) -> AsyncIterator[dict]:
+        # Server-side cursor: rows are fetched batch_size at a time, so memory
+        # stays flat no matter how long the user's ledger is.
+        result = await self.db.stream(
+            select(Transfer)
+            .where(Transfer.user_id == user_id)
+            .order_by(Transfer.created_at, Transfer.id)
+            .execution_options(yield_per=self.batch_size)
+        )
+        async for transfer in result.scalars():
+            yield to_export_row(transfer)
+
+def to_export_row(transfer: Transfer) -> dict:
+    return {
+        "id": str(transfer.id),
+        "type": transfer.type,
+        "user_id": str(transfer.user_id),
+        "status": transfer.status,
+        "reference": transfer.reference,
+        "created_at": transfer.created_at.isoformat() if transfer.created_at else None,
+        "amount": str(transfer.amount),
+        "currency": transfer.currency,
+    }
@@ -0,0 +1,37 @@
+from datetime import datetime
+from decimal import Decimal
+from fastapi import HTTPException
+from pydantic import BaseModel
+from source.common_types.currency_types import CurrencyType
+from source.transfer.application.use_cases.quote.use_case import QuoteUseCase
+
+class QuoteResponse(BaseModel):
+    id: str
+    currency: CurrencyType
+    target_currency: CurrencyType
+    amount: Decimal
+    rate: Decimal
+    converted_amount: Decimal
+    expires_at: str
+
+class QuoteRequest(BaseModel):
+    amount: Decimal
+    currency: CurrencyType
+    target_currency: CurrencyType
+
+async def quote(request: QuoteRequest):
+    use_case = QuoteUseCase()
+    try:
+        quote = await use_case.execute(amount=request.amount, currency=request.currency, target_currency=request.target_currency)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return QuoteResponse(
+        id=quote.id,
+        currency=quote.currency,
+        target_currency=quote.target_currency,
+        amount=quote.amount,
+        rate=quote.rate,
+        converted_amount=quote.converted_amount,
+        expires_at=datetime.utcfromtimestamp(quote.expires_at).isoformat(),
+    )
@@ -0,0 +1,39 @@
+from decimal import Decimal
+from uuid import uuid4
+from source.common_types.currency_types import CurrencyType
+from source.transfer.domain.value_objects.quote import Quote
+from source.transfer.infrastructure.service.price_provider import PriceProvider
+from source.transfer.infrastructure.service.quote_store import QuoteStore, quote_store
+from infrastructure.metrics import USE_CASE_SECONDS, timed
+
+class QuoteUseCase:
+    def __init__(self, store: QuoteStore = quote_store):
+        self.store = store
+
+    @timed(USE_CASE_SECONDS, "QuoteUseCase")
+    async def execute(self, amount: str, currency: str, target_currency: str) -> Quote:
+        if currency == target_currency:
+            raise ValueError("Source and destination currencies cannot be the same")
+
+        amount_decimal = Decimal(str(amount))
+        if amount_decimal <= 0:
+            raise ValueError("Amount must be positive")
+
+        currency = CurrencyType(currency).value
+        target_currency = CurrencyType(target_currency).value
+
+        snapshot = await PriceProvider.get_rate_snapshot()
+        rate = snapshot.rate(currency, target_currency)
+
+        quote = Quote(
+            id=str(uuid4()),
+            currency=currency,
+            target_currency=target_currency,
+            amount=amount_decimal,
+            rate=rate,
+            converted_amount=amount_decimal * rate,
+            expires_at=self.store.expiry(),
+        )
+        self.store.put(quote)
+
+        return quote
@@ -0,0 +1,38 @@
+import json
+import os
+from typing import Dict
+
+class Checkpoint:
+    """
+    Records which ranges of a reconciliation run are finished, and how many
+    mismatches each produced, so an interrupted run resumes where it stopped.
+    The file is replaced atomically after every range.
+    """
+
+    def __init__(self, path: str, partitions: int):
+        self.path = path
+        self.partitions = partitions
+        self.done: Dict[int, int] = {}
+
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data["partitions"] != partitions:
+                raise ValueError(f"Checkpoint {path} was written for {data['partitions']} partitions, not {partitions}")
+            self.done = {int(index): mismatches for index, mismatches in data["done"].items()}
+
+    def is_done(self, index: int) -> bool:
+        return index in self.done
+
+    def mark_done(self, index: int, mismatches: int) -> None:
+        self.done[index] = mismatches
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"partitions": self.partitions, "done": self.done}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    @property
+    def mismatches(self) -> int:
+        return sum(self.done.values())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Checks every user_balance row against the sum of its confirmed ledger rows.
+
+The user id space is split into ranges that are reconciled in parallel by a
+process pool, each process with its own database connection. Mismatches are
+appended to an NDJSON report, and finished ranges are checkpointed, so
+rerunning the same command resumes an interrupted run:
+
+    python source/transfer/application/use_cases/reconcile_balances/cli.py --partitions 256 --workers 8
+
+Exits with 1 if any mismatch was found and 2 if any range failed.
+"""
+
+import sys
+import os
+import asyncio
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../')))
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+from infrastructure.psql import models
+from infrastructure.psql.db import DATABASE_URL, STATEMENT_CACHE_SIZE
+from source.transfer.application.use_cases.reconcile_balances.checkpoint import Checkpoint
+from source.transfer.application.use_cases.reconcile_balances.use_case import ReconcileBalancesUseCase, uuid_ranges
+
+_engine = None
+
+def reconcile_range(index: int, lower, upper):
+    """Runs in a worker process; each process opens its own connections."""
+    return index, asyncio.run(_reconcile(lower, upper))
+
+async def _reconcile(lower, upper):
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(
+            DATABASE_URL,
+            poolclass=NullPool,
+            connect_args={"statement_cache_size": STATEMENT_CACHE_SIZE},
+        )
+    async with AsyncSession(_engine) as session:
+        return await ReconcileBalancesUseCase(session).execute(lower, upper)
+
+def run(partitions: int, workers: int, report_path: str, checkpoint_path: str) -> int:
+    checkpoint = Checkpoint(checkpoint_path, partitions)
+    ranges = uuid_ranges(partitions)
+    pending = [(index, lower, upper) for index, (lower, upper) in enumerate(ranges) if not checkpoint.is_done(index)]
+    failed = 0
+
+    print(f"reconciling {len(pending)} of {partitions} ranges with {workers} workers", file=sys.stderr)
+    with open(report_path, "a") as report, ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(reconcile_range, *task): task[0] for task in pending}
+        for future in as_completed(futures):
+            try:
+                index, mismatches = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"range {futures[future]} failed: {e}", file=sys.stderr)
+                continue
+
+            # The report is durable before the range is checkpointed; a crash in
+            # between reruns the range, and its lines carry the range index.
+            for mismatch in mismatches:
+                report.write(json.dumps({"range": index, **mismatch}) + "\n")
+            report.flush()
+            os.fsync(report.fileno())
+            checkpoint.mark_done(index, len(mismatches))
+            print(f"range {index}: {len(mismatches)} mismatches ({len(checkpoint.done)}/{partitions} done)", file=sys.stderr)
+
+    print(f"{checkpoint.mismatches} mismatches in {len(checkpoint.done)}/{partitions} ranges", file=sys.stderr)
+    if failed:
+        return 2
+    return 1 if checkpoint.mismatches else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconcile user balances against the transfer ledger")
+    parser.add_argument("--partitions", type=int, default=256, help="Number of user id ranges (default 256)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: CPU count)")
+    parser.add_argument("--report", default="reconciliation.ndjson", help="NDJSON file mismatches are appended to")
+    parser.add_argument("--checkpoint", default="reconciliation.checkpoint.json", help="Progress file used to resume")
+    args = parser.parse_args()
+
+    sys.exit(run(args.partitions, args.workers, args.report, args.checkpoint))
+
+if __name__ == "__main__":
+    main()
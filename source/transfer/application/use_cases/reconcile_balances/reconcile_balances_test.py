@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import tempfile
+import unittest
+import uuid
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../')))
+
+from sqlalchemy.dialects import postgresql
+from infrastructure.psql import models
+from source.transfer.application.use_cases.reconcile_balances.checkpoint import Checkpoint
+from source.transfer.application.use_cases.reconcile_balances.use_case import ReconcileBalancesUseCase, uuid_ranges
+
+class TestUuidRanges(unittest.TestCase):
+
+    def test_ranges_cover_the_whole_space_without_gaps(self):
+        ranges = uuid_ranges(8)
+
+        self.assertEqual(len(ranges), 8)
+        self.assertIsNone(ranges[0][0])
+        self.assertIsNone(ranges[-1][1])
+        for (_, upper), (lower, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(upper, lower)
+
+    def test_single_partition_is_unbounded(self):
+        self.assertEqual(uuid_ranges(1), [(None, None)])
+
+class TestReconcileBalancesUseCase(unittest.IsolatedAsyncioTestCase):
+
+    async def test_reports_mismatches_for_the_range(self):
+        user_id = uuid.uuid4()
+        result = MagicMock()
+        result.all.return_value = [
+            SimpleNamespace(user_id=user_id, currency="USD", balance=Decimal("10"), ledger=Decimal("7")),
+            SimpleNamespace(user_id=user_id, currency="BTC", balance=None, ledger=Decimal("1")),
+        ]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        lower, upper = uuid_ranges(4)[1]
+
+        mismatches = await ReconcileBalancesUseCase(db).execute(lower, upper)
+
+        self.assertEqual(mismatches[0], {"user_id": str(user_id), "currency": "USD", "balance": "10", "ledger": "7"})
+        self.assertIsNone(mismatches[1]["balance"])
+
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("FULL OUTER JOIN", sql)
+        self.assertIn("user_balance.user_id >= ", sql)
+        self.assertIn("transfer.user_id < ", sql)
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "checkpoint.json")
+
+    def test_resumes_finished_ranges(self):
+        Checkpoint(self.path, partitions=4).mark_done(2, mismatches=3)
+
+        resumed = Checkpoint(self.path, partitions=4)
+
+        self.assertTrue(resumed.is_done(2))
+        self.assertFalse(resumed.is_done(0))
+        self.assertEqual(resumed.mismatches, 3)
+
+    def test_refuses_checkpoint_from_another_partitioning(self):
+        Checkpoint(self.path, partitions=4).mark_done(0, mismatches=0)
+
+        with self.assertRaises(ValueError):
+            Checkpoint(self.path, partitions=8)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import uuid
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from source.common_types.transfer_status_types import TransferStatusType
+from source.transfer.domain.entities.transfer_entity import Transfer
+from source.user.domain.entities.user_balance.user_balance_entity import UserBalance
+
+UuidRange = Tuple[Optional[uuid.UUID], Optional[uuid.UUID]]
+
+def uuid_ranges(partitions: int) -> List[UuidRange]:
+    """
+    Splits the UUID space into `partitions` contiguous [lower, upper) ranges.
+    Random (v4) ids spread evenly, so every range holds about as many users.
+    """
+    if partitions < 1:
+        raise ValueError("partitions must be at least 1")
+    step = (1 << 128) // partitions
+    bounds = [uuid.UUID(int=step * i) for i in range(1, partitions)]
+    return list(zip([None] + bounds, bounds + [None]))
+
+class ReconcileBalancesUseCase:
+    """
+    Compares stored balances with the sum of confirmed ledger rows for every
+    user in one id range.
+
+    The comparison runs as one aggregate query, so it reads balances and ledger
+    from the same snapshot and only mismatches leave the database. A balance
+    row without ledger rows must be zero; ledger rows without a balance row are
+    always reported.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def execute(self, lower: Optional[uuid.UUID], upper: Optional[uuid.UUID]) -> List[Dict]:
+        ledger = (
+            select(Transfer.user_id, Transfer.currency, func.sum(Transfer.amount).label("total"))
+            .where(Transfer.status == TransferStatusType.CONFIRMED.value, *_in_range(Transfer.user_id, lower, upper))
+            .group_by(Transfer.user_id, Transfer.currency)
+            .subquery("ledger")
+        )
+        balances = (
+            select(UserBalance.user_id, UserBalance.currency, UserBalance.amount)
+            .where(*_in_range(UserBalance.user_id, lower, upper))
+            .subquery("balances")
+        )
+
+        balance = func.coalesce(balances.c.amount, 0)
+        total = func.coalesce(ledger.c.total, 0)
+        result = await self.db.execute(
+            select(
+                func.coalesce(balances.c.user_id, ledger.c.user_id).label("user_id"),
+                func.coalesce(balances.c.currency, ledger.c.currency).label("currency"),
+                balances.c.amount.label("balance"),
+                ledger.c.total.label("ledger"),
+            )
+            .select_from(balances.join(
+                ledger,
+                and_(balances.c.user_id == ledger.c.user_id, balances.c.currency == ledger.c.currency),
+                full=True,
+            ))
+            .where((balance != total) | (balances.c.user_id.is_(None)))
+            .order_by("user_id", "currency")
+        )
+
+        return [
+            {
+                "user_id": str(row.user_id),
+                "currency": row.currency,
+                "balance": None if row.balance is None else str(row.balance),
+                "ledger": str(row.ledger or Decimal("0")),
+            }
+            for row in result.all()
+        ]
+
+def _in_range(column, lower: Optional[uuid.UUID], upper: Optional[uuid.UUID]) -> list:
+    criteria = []
+    if lower is not None:
+        criteria.append(column >= lower)
+    if upper is not None:
+        criteria.append(column < upper)
+    return criteria
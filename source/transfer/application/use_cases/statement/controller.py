@@ -0,0 +1,40 @@
+from datetime import datetime
+from decimal import Decimal
+from fastapi import HTTPException, Depends
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from infrastructure.psql.replica import get_read_db
+from source.common_types.currency_types import CurrencyType
+from source.transfer.application.use_cases.statement.use_case import StatementUseCase
+
+class StatementLine(BaseModel):
+    currency: CurrencyType
+    opening_balance: Decimal
+    credits: Decimal
+    debits: Decimal
+    closing_balance: Decimal
+
+class StatementResponse(BaseModel):
+    user_id: str
+    start: str
+    end: str
+    balances: list[StatementLine]
+
+async def statement(
+    user_id: str,
+    start: datetime,
+    end: datetime,
+    db: AsyncSession = Depends(get_read_db)
+):
+    use_case = StatementUseCase(db)
+    try:
+        balances = await use_case.execute(user_id=user_id, start=start, end=end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StatementResponse(
+        user_id=user_id,
+        start=start.isoformat(),
+        end=end.isoformat(),
+        balances=[StatementLine(**line) for line in balances],
+    )
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+import uuid
+from collections import namedtuple
+from datetime import datetime
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../')))
+
+from infrastructure.psql.testing import compiled_sql, fake_result, fake_session
+from source.transfer.application.use_cases.statement.use_case import StatementUseCase
+
+Row = namedtuple("Row", ["currency", "balance", "credits", "debits", "after_end"])
+
+class TestStatementUseCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.user_id = str(uuid.uuid4())
+        self.db = fake_session()
+        self.use_case = StatementUseCase(self.db)
+        self.start = datetime(2024, 1, 1)
+        self.end = datetime(2024, 2, 1)
+
+    def _returns(self, rows):
+        self.db.execute.return_value = fake_result(rows)
+
+    async def test_reads_only_transfers_since_start_in_one_query(self):
+        self._returns([Row("USD", Decimal("120"), Decimal("50"), Decimal("-30"), None)])
+
+        await self.use_case.execute(self.user_id, self.start, self.end)
+
+        self.db.execute.assert_awaited_once()
+        sql = compiled_sql(self.db.execute.await_args, literal_binds=True)
+        self.assertIn("transfer.created_at >= '2024-01-01 00:00:00'", sql)
+        self.assertNotIn("transfer.created_at < '2024-01-01 00:00:00'", sql)
+        self.assertIn("sum(transfer.amount) FILTER (WHERE", sql)
+        self.assertIn("GROUP BY transfer.currency", sql)
+        self.assertIn("FROM user_balance LEFT OUTER JOIN", sql)
+
+    async def test_computes_closing_balance(self):
+        self._returns([
+            # 10 more USD arrived after the period ended.
+            Row("USD", Decimal("130"), Decimal("50"), Decimal("-30"), Decimal("10")),
+            Row("BTC", Decimal("0.5"), Decimal("0.5"), None, None),
+            Row("ARS", Decimal("0"), None, None, None),
+        ])
+
+        statement = await self.use_case.execute(self.user_id, self.start, self.end)
+        by_currency = {line["currency"]: line for line in statement}
+
+        self.assertEqual(by_currency["USD"]["opening_balance"], Decimal("100"))
+        self.assertEqual(by_currency["USD"]["closing_balance"], Decimal("120"))
+        self.assertEqual(by_currency["BTC"]["opening_balance"], Decimal("0"))
+        self.assertEqual(by_currency["BTC"]["closing_balance"], Decimal("0.5"))
+        self.assertEqual(by_currency["ARS"]["closing_balance"], Decimal("0"))
+        self.assertEqual(len(statement), 4)
+
+    async def test_rejects_empty_period(self):
+        with self.assertRaises(ValueError):
+            await self.use_case.execute(self.user_id, self.end, self.start)
+
+        self.db.execute.assert_not_awaited()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, select
+from source.common_types.currency_types import CurrencyType
+from source.common_types.transfer_status_types import TransferStatusType
+from source.transfer.application.timestamps import as_naive_utc
+from source.transfer.domain.entities.transfer_entity import Transfer
+from source.user.domain.entities.user_balance.user_balance_entity import UserBalance
+from infrastructure.metrics import USE_CASE_SECONDS, timed
+
+class StatementUseCase:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @timed(USE_CASE_SECONDS, "StatementUseCase")
+    async def execute(self, user_id: str, start: datetime, end: datetime) -> List[Dict]:
+        start = as_naive_utc(start)
+        end = as_naive_utc(end)
+        if start >= end:
+            raise ValueError("Statement start must be before end")
+
+        # Anchored on the stored balance, which always equals the sum of the
+        # user's confirmed transfers: only rows since `start` are read, so the
+        # cost follows the period and its trailing months rather than the whole
+        # history, and partitions before `start` are pruned. Reading balances
+        # and movements in one statement keeps them on the same snapshot.
+        in_period = Transfer.created_at < end
+        total = func.sum(Transfer.amount)
+        movements = (
+            select(
+                Transfer.currency,
+                total.filter(and_(in_period, Transfer.amount > 0)).label("credits"),
+                total.filter(and_(in_period, Transfer.amount < 0)).label("debits"),
+                total.filter(Transfer.created_at >= end).label("after_end"),
+            )
+            .where(
+                Transfer.user_id == user_id,
+                Transfer.status == TransferStatusType.CONFIRMED.value,
+                Transfer.created_at >= start,
+            )
+            .group_by(Transfer.currency)
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(
+                UserBalance.currency,
+                UserBalance.amount.label("balance"),
+                movements.c.credits,
+                movements.c.debits,
+                movements.c.after_end,
+            )
+            .outerjoin(movements, movements.c.currency == UserBalance.currency)
+            .where(UserBalance.user_id == user_id)
+        )
+        totals = {row.currency: row for row in result.all()}
+
+        statement = []
+        for currency in CurrencyType.valid_currencies():
+            row = totals.get(currency.value)
+            balance = (row.balance if row else None) or Decimal("0")
+            credits = (row.credits if row else None) or Decimal("0")
+            debits = (row.debits if row else None) or Decimal("0")
+            after_end = (row.after_end if row else None) or Decimal("0")
+            closing = balance - after_end
+            statement.append({
+                "currency": currency.value,
+                "opening_balance": closing - credits - debits,
+                "credits": credits,
+                "debits": debits,
+                "closing_balance": closing,
+            })
+        return statement
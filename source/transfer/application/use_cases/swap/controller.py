@@ -1,11 +1,14 @@
 from decimal import Decimal
-from fastapi import HTTPException, Depends
+from typing import Optional
+from fastapi import HTTPException, Header
 from pydantic import BaseModel
 from source.common_types.currency_types import CurrencyType
 from source.common_types.transfer_status_types import TransferStatusType
 from sqlalchemy.ext.asyncio import AsyncSession
-from infrastructure.psql.db import get_db
+from infrastructure.psql.db import UnitOfWork
 from source.transfer.application.use_cases.swap.use_case import SwapUseCase
+from source.transfer.application.use_cases.swap.mailbox import SWAP_MAILBOX, swap_mailbox
+from source.transfer.infrastructure.idempotency import idempotency
 
 class SwapResponse(BaseModel):
     id: str
@@ -20,19 +23,38 @@ class SwapRequest(BaseModel):
     amount: Decimal
     currency: CurrencyType
     target_currency: CurrencyType
+    quote_id: Optional[str] = None
 
 async def swap(
     request: SwapRequest,
-    db: AsyncSession = Depends(get_db)
+    idempotency_key: Optional[str] = Header(None, max_length=255)
 ):
+    # The session is opened here rather than through `get_db` so a request waiting
+    # in a mailbox does not hold a pooled connection it cannot use yet.
+    if SWAP_MAILBOX:
+        # Swaps of one user run one after another in that user's mailbox, each in
+        # its own transaction, instead of queueing on the same balance row locks
+        # while holding pool connections.
+        return await swap_mailbox.run(request.user_id, lambda: _swap_in_unit_of_work(request, idempotency_key))
+    return await _swap_in_unit_of_work(request, idempotency_key)
+
+async def _swap_in_unit_of_work(request: SwapRequest, idempotency_key: Optional[str]):
+    async with UnitOfWork() as uow:
+        return await _swap(uow.session, request, idempotency_key)
+
+async def _swap(db: AsyncSession, request: SwapRequest, idempotency_key: Optional[str]):
+    payload = request.model_dump(mode="json")
     use_case = SwapUseCase(db)
     try:
-        transaction = await use_case.execute(user_id=request.user_id, amount=request.amount, currency=request.currency, target_currency=request.target_currency)
+        if idempotency_key is not None:
+            stored = await idempotency.claim(db, "swap", idempotency_key, payload)
+            if stored is not None:
+                return stored
+        transaction = await use_case.execute(user_id=request.user_id, amount=request.amount, currency=request.currency, target_currency=request.target_currency, quote_id=request.quote_id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    
-    return SwapResponse(
+    response = SwapResponse(
         id=transaction.reference,
         type=transaction.type,
         status=transaction.status,
@@ -40,3 +62,6 @@ async def swap(
         created_at=transaction.created_at.isoformat(),
         amount=transaction.amount
     )
+    if idempotency_key is not None:
+        await idempotency.save(db, "swap", idempotency_key, payload, response.model_dump(mode="json"))
+    return response
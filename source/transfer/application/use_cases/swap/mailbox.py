@@ -0,0 +1,12 @@
+import os
+from dotenv import load_dotenv
+from source.transfer.infrastructure.keyed_mailbox import KeyedMailbox
+
+load_dotenv()
+
+SWAP_MAILBOX = os.getenv("SWAP_MAILBOX", "false").lower() == "true"
+
+swap_mailbox = KeyedMailbox(
+    shards=int(os.getenv("SWAP_MAILBOX_SHARDS", "64")),
+    queue_size=int(os.getenv("SWAP_MAILBOX_QUEUE_SIZE", "1000")),
+)
@@ -1,3 +1,5 @@
+from decimal import Decimal
+from typing import Optional
 from source.transfer.application.use_cases.swap.strategies.crypto_to_crypto.crypto_to_crypto import CryptoToCryptoStrategy
 from source.transfer.application.use_cases.swap.strategies.crypto_to_fiat.crypto_to_fiat import CryptoToFiatStrategy
 from source.transfer.application.use_cases.swap.swap_result import SwapResult
@@ -29,8 +31,8 @@ class SwapStrategyFactory:
             raise ValueError(f"Currency {to_currency} is not a supported currency")
     
         
-    async def execute_swap(self, from_currency: str, to_currency: str, amount: float, balance) -> SwapResult:
+    async def execute_swap(self, from_currency: str, to_currency: str, amount: float, user_id: str, rate: Optional[Decimal] = None) -> SwapResult:
         self._validate_currencies(from_currency, to_currency)
         strategy = self.create_strategy(from_currency, to_currency)
-        return await strategy.execute_swap(from_currency, to_currency, amount, balance) 
+        return await strategy.execute_swap(from_currency, to_currency, amount, user_id, rate)
     
\ No newline at end of file
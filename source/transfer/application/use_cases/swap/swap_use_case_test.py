@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+import uuid
+from decimal import Decimal
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../')))
+
+from infrastructure.psql.testing import compiled_sql, fake_result, fake_session
+from source.transfer.application.use_cases.swap.use_case import SwapUseCase
+from source.transfer.domain.value_objects.rate_snapshot import RateSnapshot
+from infrastructure.metrics import SWAPS
+from infrastructure.psql.db import UnitOfWork
+from source.transfer.domain.value_objects.quote import Quote
+from source.transfer.infrastructure.service.quote_store import QuoteStore
+
+class TestSwapUseCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.user_id = str(uuid.uuid4())
+        self.db = fake_session()
+        self.use_case = SwapUseCase(self.db)
+
+    @patch('source.transfer.application.use_cases.swap.strategies.fiat_to_fiat_strategy.fiat_to_fiat_strategy.PriceProvider.get_rate_snapshot')
+    async def test_locks_updates_balances_and_writes_ledger(self, mock_snapshot):
+        mock_snapshot.return_value = RateSnapshot({("USD", "ARS"): Decimal("400")})
+        self.db.execute.side_effect = [
+            fake_result([]),
+            fake_result([("USD", Decimal("90")), ("ARS", Decimal("4000"))]),
+            fake_result([]),
+        ]
+        swaps_before = SWAPS.value("FiatToFiatStrategy", "ok")
+
+        credit = await self.use_case.execute(self.user_id, "10", "USD", "ARS")
+
+        self.assertEqual(self.db.execute.await_count, 3)
+        lock_sql, update_sql, insert_sql = [compiled_sql(c) for c in self.db.execute.await_args_list]
+        self.assertIn("ORDER BY user_balance.user_id, user_balance.currency", lock_sql)
+        self.assertTrue(lock_sql.endswith("FOR UPDATE"))
+        self.assertTrue(update_sql.startswith("UPDATE user_balance"))
+        self.assertIn("RETURNING", update_sql)
+        self.assertTrue(insert_sql.startswith("INSERT INTO transfer"))
+        # The request's unit of work commits; the use case only stages changes.
+        self.db.commit.assert_not_awaited()
+
+        self.assertEqual(credit.currency, "ARS")
+        self.assertEqual(Decimal(credit.amount), Decimal("4000"))
+        # Counted as settled only once the unit of work commits.
+        self.assertEqual(SWAPS.value("FiatToFiatStrategy", "ok"), swaps_before)
+
+    @patch('source.transfer.application.use_cases.swap.strategies.fiat_to_fiat_strategy.fiat_to_fiat_strategy.PriceProvider.get_rate_snapshot')
+    async def test_insufficient_balance_raises_before_ledger_insert(self, mock_snapshot):
+        mock_snapshot.return_value = RateSnapshot({("USD", "ARS"): Decimal("400")})
+        self.db.execute.side_effect = [
+            fake_result([]),
+            fake_result([("ARS", Decimal("4000"))]),
+            fake_result(["USD", "ARS"]),
+        ]
+        rejected_before = SWAPS.value("FiatToFiatStrategy", "rejected")
+
+        with self.assertRaises(ValueError) as context:
+            await self.use_case.execute(self.user_id, "10", "USD", "ARS")
+
+        self.assertEqual(str(context.exception), "Insufficient balance.")
+        statements = [compiled_sql(c) for c in self.db.execute.await_args_list]
+        self.assertFalse(any(sql.startswith("INSERT INTO transfer") for sql in statements))
+        self.assertEqual(SWAPS.value("FiatToFiatStrategy", "rejected"), rejected_before + 1)
+
+    @patch('source.transfer.application.use_cases.swap.strategies.fiat_to_fiat_strategy.fiat_to_fiat_strategy.PriceProvider.get_rate_snapshot')
+    async def test_quote_survives_a_failed_swap_and_is_spent_on_commit(self, mock_snapshot):
+        quotes = QuoteStore(max_size=10, ttl=30)
+        quotes.put(Quote("q1", "USD", "ARS", Decimal("10"), Decimal("400"), Decimal("4000"), quotes.expiry()))
+        use_case = SwapUseCase(self.db, quotes)
+        self.db.execute.side_effect = [
+            fake_result([]),
+            fake_result([("ARS", Decimal("4000"))]),
+            fake_result(["USD", "ARS"]),
+        ]
+
+        with self.assertRaises(ValueError):
+            async with UnitOfWork(session_factory=lambda: self.db):
+                await use_case.execute(self.user_id, "10", "USD", "ARS", quote_id="q1")
+
+        self.assertIsNotNone(quotes.get("q1"))
+
+        self.db.execute.side_effect = [
+            fake_result([]),
+            fake_result([("USD", Decimal("90")), ("ARS", Decimal("4000"))]),
+            fake_result([]),
+        ]
+        async with UnitOfWork(session_factory=lambda: self.db):
+            await use_case.execute(self.user_id, "10", "USD", "ARS", quote_id="q1")
+
+        self.assertIsNone(quotes.get("q1"))
+        mock_snapshot.assert_not_awaited()
+
+    @patch('source.transfer.application.use_cases.swap.strategies.fiat_to_fiat_strategy.fiat_to_fiat_strategy.PriceProvider.get_rate_snapshot')
+    async def test_outcome_follows_the_commit(self, mock_snapshot):
+        mock_snapshot.return_value = RateSnapshot({("USD", "ARS"): Decimal("400")})
+        ok_before = SWAPS.value("FiatToFiatStrategy", "ok")
+        failed_before = SWAPS.value("FiatToFiatStrategy", "failed")
+
+        self.db.execute.side_effect = [
+            fake_result([]),
+            fake_result([("USD", Decimal("90")), ("ARS", Decimal("4000"))]),
+            fake_result([]),
+        ]
+        async with UnitOfWork(session_factory=lambda: self.db):
+            await self.use_case.execute(self.user_id, "10", "USD", "ARS")
+
+        self.db.commit.side_effect = RuntimeError("connection lost")
+        self.db.execute.side_effect = [
+            fake_result([]),
+            fake_result([("USD", Decimal("80")), ("ARS", Decimal("8000"))]),
+            fake_result([]),
+        ]
+        with self.assertRaises(RuntimeError):
+            async with UnitOfWork(session_factory=lambda: self.db):
+                await self.use_case.execute(self.user_id, "10", "USD", "ARS")
+
+        self.assertEqual(SWAPS.value("FiatToFiatStrategy", "ok"), ok_before + 1)
+        self.assertEqual(SWAPS.value("FiatToFiatStrategy", "failed"), failed_before + 1)
+
+    async def test_non_positive_amount_skips_database(self):
+        with self.assertRaises(ValueError):
+            await self.use_case.execute(self.user_id, "0", "USD", "ARS")
+
+        self.db.execute.assert_not_awaited()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,53 +1,58 @@
 from decimal import Decimal
+from typing import Optional
 from source.transfer.application.use_cases.swap.strategies.swap_strategy_factory.swap_strategy_factory import SwapStrategyFactory
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from source.user.domain.entities.user_entity import User
-from source.user.domain.entities.user_balance.user_balance_entity import UserBalance
+from infrastructure.psql.db import after_commit, after_rollback
+from source.user.infrastructure.balance_mutations import apply_balance_changes
 from source.transfer.domain.entities.transfer_entity import Transfer
+from source.transfer.infrastructure.ledger import insert_transfers
+from source.transfer.infrastructure.service.quote_store import QuoteStore, quote_store
+from infrastructure.metrics import SWAPS, USE_CASE_SECONDS, timed
 
 class SwapUseCase:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, quotes: QuoteStore = quote_store):
         self.db = db
+        self.quotes = quotes
 
-    async def execute(self, user_id: str, amount: str, currency: str, target_currency: str) -> Transfer:
+    @timed(USE_CASE_SECONDS, "SwapUseCase")
+    async def execute(self, user_id: str, amount: str, currency: str, target_currency: str, quote_id: Optional[str] = None) -> Transfer:
         if currency == target_currency:
             raise ValueError("Source and destination currencies cannot be the same")
-        
-        result = await self.db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
-        if not user:
-            raise ValueError('User not found')
-        
-        result = await self.db.execute(
-            select(UserBalance).where(UserBalance.user_id == user_id, UserBalance.currency == currency)
-        )
-        balance = result.scalar_one_or_none()
-        if not balance:
-            raise ValueError(f'Balance for {currency} not found')
+
+        rate = None
+        if quote_id is not None:
+            quote = self.quotes.get(quote_id)
+            if quote is None:
+                raise ValueError("Quote not found or expired")
+            if not quote.matches(currency, target_currency, amount):
+                raise ValueError("Swap does not match the quoted currencies and amount")
+            if not self.quotes.reserve(quote_id):
+                raise ValueError("Quote is already being settled")
+            # The quote is only spent if the swap commits; any failure hands it back for a retry.
+            after_commit(self.db, lambda: self.quotes.take(quote_id))
+            after_rollback(self.db, lambda: self.quotes.release(quote_id))
+            rate = quote.rate
         
         amount_decimal = Decimal(str(amount))
         if amount_decimal <= 0:
             raise ValueError("Amount must be positive")
-        
-        swap_strategy = SwapStrategyFactory()
-        transactions = await swap_strategy.execute_swap(currency, target_currency, float(amount_decimal), balance)
-        
-        result = await self.db.execute(
-            select(UserBalance).where(UserBalance.user_id == user_id, UserBalance.currency == target_currency)
-        )
-        target_balance = result.scalar_one_or_none()
-        if not target_balance:
-           raise ValueError(f'Balance for {target_balance} not found')
-        
-        balance.decrement(abs(Decimal(transactions.debit.amount)))
-        target_balance.increment(abs(Decimal(transactions.credit.amount)))
 
-        self.db.add(balance)
-        self.db.add(target_balance)
-        self.db.add(transactions.debit)
-        self.db.add(transactions.credit)
-        await self.db.commit()
-        
-        return transactions.credit
+        strategy = SwapStrategyFactory().create_strategy(currency, target_currency)
+        strategy_name = type(strategy).__name__
+        try:
+            transactions = await strategy.execute_swap(currency, target_currency, float(amount_decimal), user_id, rate)
 
+            # Debit and credit land in one conditional UPDATE; the debit only applies
+            # if the balance covers it, so there is no read-modify-write to race on.
+            await apply_balance_changes(self.db, user_id, {
+                currency: transactions.debit.amount,
+                target_currency: transactions.credit.amount,
+            })
+        except ValueError:
+            SWAPS.inc(strategy_name, "rejected")
+            raise
+        await insert_transfers(self.db, [transactions.debit, transactions.credit])
+        after_commit(self.db, lambda: SWAPS.inc(strategy_name, "ok"))
+        after_rollback(self.db, lambda: SWAPS.inc(strategy_name, "failed"))
+
+        return transactions.credit
@@ -0,0 +1,63 @@
+import os
+import uuid
+from decimal import Decimal
+from typing import List, Optional
+from fastapi import HTTPException, Depends
+from pydantic import BaseModel, Field
+from source.common_types.currency_types import CurrencyType
+from source.common_types.transfer_status_types import TransferStatusType
+from sqlalchemy.ext.asyncio import AsyncSession
+from infrastructure.psql.db import get_db
+from source.transfer.application.use_cases.swap_batch.use_case import SwapBatchUseCase
+
+SWAP_BATCH_MAX_SIZE = int(os.getenv("SWAP_BATCH_MAX_SIZE", "500"))
+
+class SwapBatchItem(BaseModel):
+    user_id: uuid.UUID
+    amount: Decimal
+    currency: CurrencyType
+    target_currency: CurrencyType
+
+class SwapBatchRequest(BaseModel):
+    swaps: List[SwapBatchItem] = Field(min_length=1, max_length=SWAP_BATCH_MAX_SIZE)
+
+class SwapBatchItemResponse(BaseModel):
+    index: int
+    status: TransferStatusType
+    id: Optional[str] = None
+    amount: Optional[Decimal] = None
+    currency: Optional[CurrencyType] = None
+    created_at: Optional[str] = None
+    error: Optional[str] = None
+
+class SwapBatchResponse(BaseModel):
+    accepted: int
+    rejected: int
+    results: List[SwapBatchItemResponse]
+
+async def swap_batch(
+    request: SwapBatchRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    use_case = SwapBatchUseCase(db)
+    try:
+        results = await use_case.execute([swap.model_dump() for swap in request.swaps])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    items = [
+        SwapBatchItemResponse(
+            index=result.index,
+            status=result.swap.credit.status,
+            id=result.swap.credit.reference,
+            amount=result.swap.credit.amount,
+            currency=result.swap.credit.currency,
+            created_at=result.swap.credit.created_at.isoformat(),
+        )
+        if result.accepted else
+        SwapBatchItemResponse(index=result.index, status=TransferStatusType.FAILED, error=result.error)
+        for result in results
+    ]
+    accepted = sum(1 for result in results if result.accepted)
+
+    return SwapBatchResponse(accepted=accepted, rejected=len(results) - accepted, results=items)
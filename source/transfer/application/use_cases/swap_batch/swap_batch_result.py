@@ -0,0 +1,12 @@
+from typing import Optional
+from source.transfer.application.use_cases.swap.swap_result import SwapResult
+
+class SwapBatchResult:
+    def __init__(self, index: int, swap: Optional[SwapResult] = None, error: Optional[str] = None):
+        self.index = index
+        self.swap = swap
+        self.error = error
+
+    @property
+    def accepted(self) -> bool:
+        return self.swap is not None
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../')))
+
+from infrastructure.psql.testing import compiled_sql, fake_result, fake_session
+from source.transfer.application.use_cases.swap_batch.use_case import SwapBatchUseCase
+from source.transfer.domain.value_objects.rate_snapshot import RateSnapshot
+
+SNAPSHOT = RateSnapshot({
+    ("USD", "ARS"): Decimal("400"),
+    ("USD", "BTC"): Decimal("0.00002"),
+})
+
+@patch('source.transfer.application.use_cases.swap_batch.use_case.PriceProvider.get_rate_snapshot', new_callable=AsyncMock, return_value=SNAPSHOT)
+class TestSwapBatchUseCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.alice = uuid.uuid4()
+        self.bob = uuid.uuid4()
+        self.db = fake_session()
+        self.use_case = SwapBatchUseCase(self.db)
+
+    async def test_prices_once_locks_in_order_and_writes_in_two_statements(self, mock_snapshot):
+        self.db.execute.side_effect = [
+            fake_result([
+                (self.alice, "ARS", Decimal("0")),
+                (self.alice, "BTC", Decimal("0")),
+                (self.alice, "USD", Decimal("100")),
+                (self.bob, "ARS", Decimal("0")),
+                (self.bob, "USD", Decimal("10")),
+            ]),
+            fake_result([]),
+            fake_result([]),
+        ]
+
+        results = await self.use_case.execute([
+            {"user_id": self.alice, "amount": Decimal("50"), "currency": "USD", "target_currency": "ARS"},
+            {"user_id": self.bob, "amount": Decimal("10"), "currency": "USD", "target_currency": "ARS"},
+            {"user_id": self.alice, "amount": Decimal("50"), "currency": "USD", "target_currency": "BTC"},
+        ])
+
+        self.assertTrue(all(result.accepted for result in results))
+        mock_snapshot.assert_awaited_once()
+        self.assertEqual(results[0].swap.credit.amount, Decimal("20000"))
+        self.assertEqual(results[2].swap.credit.amount, Decimal("0.001"))
+
+        lock_sql, update_sql, insert_sql = [compiled_sql(c) for c in self.db.execute.await_args_list]
+        self.assertIn("ORDER BY user_balance.user_id, user_balance.currency", lock_sql)
+        self.assertIn("FOR UPDATE", lock_sql)
+        self.assertTrue(update_sql.startswith("UPDATE user_balance"))
+        self.assertTrue(insert_sql.startswith("INSERT INTO transfer"))
+        self.assertEqual(len(self.db.execute.await_args_list[2].args[1]), 6)
+
+    async def test_checks_each_swap_against_the_running_balance(self, mock_snapshot):
+        self.db.execute.side_effect = [
+            fake_result([(self.alice, "ARS", Decimal("0")), (self.alice, "USD", Decimal("60"))]),
+            fake_result([]),
+            fake_result([]),
+        ]
+
+        results = await self.use_case.execute([
+            {"user_id": self.alice, "amount": Decimal("50"), "currency": "USD", "target_currency": "ARS"},
+            {"user_id": self.alice, "amount": Decimal("50"), "currency": "USD", "target_currency": "ARS"},
+            {"user_id": self.alice, "amount": Decimal("10"), "currency": "USD", "target_currency": "ARS"},
+        ])
+
+        self.assertTrue(results[0].accepted)
+        self.assertEqual(results[1].error, "Insufficient balance.")
+        self.assertTrue(results[2].accepted)
+
+    async def test_reports_invalid_and_unknown_items(self, mock_snapshot):
+        stranger = uuid.uuid4()
+        self.db.execute.side_effect = [
+            fake_result([]),
+            fake_result([]),
+            fake_result([]),
+            fake_result([]),
+        ]
+
+        results = await self.use_case.execute([
+            {"user_id": self.alice, "amount": Decimal("1"), "currency": "USD", "target_currency": "USD"},
+            {"user_id": self.alice, "amount": Decimal("0"), "currency": "USD", "target_currency": "ARS"},
+            {"user_id": stranger, "amount": Decimal("1"), "currency": "USD", "target_currency": "ARS"},
+        ])
+
+        self.assertEqual(results[0].error, "Source and destination currencies cannot be the same")
+        self.assertEqual(results[1].error, "Amount must be positive")
+        self.assertEqual(results[2].error, "User not found")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from source.common_types.currency_types import CurrencyType
+from source.transfer.application.use_cases.swap.strategies.swap_strategy_factory.swap_strategy_factory import SwapStrategyFactory
+from source.transfer.application.use_cases.swap_batch.swap_batch_result import SwapBatchResult
+from source.transfer.infrastructure.ledger import insert_transfers
+from source.transfer.infrastructure.service.price_provider import PriceProvider
+from source.user.infrastructure.balance_mutations import apply_balance_increments, describe_missing_balances, lock_balances
+from infrastructure.metrics import SWAPS, USE_CASE_SECONDS, timed
+from infrastructure.psql.db import after_commit, after_rollback
+
+class SwapBatchUseCase:
+    """
+    Settles many swaps in one transaction.
+
+    Swaps are grouped by currency pair so each pair is priced once from a single
+    rate snapshot and served by one strategy. Every balance the batch touches is
+    locked up front in a fixed order, swaps are then checked one by one against
+    the running balances, and the net change per balance is written with one
+    UPDATE followed by one INSERT for all ledger rows.
+    """
+
+    def __init__(self, db: AsyncSession, strategies: Optional[SwapStrategyFactory] = None):
+        self.db = db
+        self.strategies = strategies or SwapStrategyFactory()
+
+    @timed(USE_CASE_SECONDS, "SwapBatchUseCase")
+    async def execute(self, swaps: List[Dict]) -> List[SwapBatchResult]:
+        results: List[SwapBatchResult] = [None] * len(swaps)
+        by_pair: Dict[Tuple[str, str], list] = defaultdict(list)
+
+        for index, swap in enumerate(swaps):
+            currency = CurrencyType(swap["currency"]).value
+            target_currency = CurrencyType(swap["target_currency"]).value
+            amount = Decimal(str(swap["amount"]))
+            if currency == target_currency:
+                results[index] = SwapBatchResult(index, error="Source and destination currencies cannot be the same")
+            elif amount <= 0:
+                results[index] = SwapBatchResult(index, error="Amount must be positive")
+            else:
+                by_pair[(currency, target_currency)].append((index, str(swap["user_id"]), amount))
+
+        if not by_pair:
+            return results
+
+        snapshot = await PriceProvider.get_rate_snapshot()
+        pending = []
+        strategy_names: Dict[int, str] = {}
+        for (currency, target_currency), items in by_pair.items():
+            rate = snapshot.rate(currency, target_currency)
+            strategy = self.strategies.create_strategy(currency, target_currency)
+            for index, user_id, amount in items:
+                swap = await strategy.execute_swap(currency, target_currency, float(amount), user_id, rate)
+                pending.append((index, user_id, swap))
+                strategy_names[index] = type(strategy).__name__
+
+        touched = {(user_id, transfer.currency) for _, user_id, swap in pending for transfer in (swap.debit, swap.credit)}
+        balances = await lock_balances(self.db, touched)
+        errors = await describe_missing_balances(self.db, touched - set(balances))
+
+        deltas: Dict[Tuple[str, str], Decimal] = defaultdict(Decimal)
+        transfers = []
+        settled: List[str] = []
+        for index, user_id, swap in sorted(pending, key=lambda item: item[0]):
+            debit_key = (user_id, swap.debit.currency)
+            credit_key = (user_id, swap.credit.currency)
+            missing = errors.get(debit_key) or errors.get(credit_key)
+            if missing:
+                results[index] = SwapBatchResult(index, error=missing)
+                SWAPS.inc(strategy_names[index], "rejected")
+                continue
+            if balances[debit_key] + swap.debit.amount < 0:
+                results[index] = SwapBatchResult(index, error="Insufficient balance.")
+                SWAPS.inc(strategy_names[index], "rejected")
+                continue
+
+            balances[debit_key] += swap.debit.amount
+            balances[credit_key] += swap.credit.amount
+            deltas[debit_key] += swap.debit.amount
+            deltas[credit_key] += swap.credit.amount
+            transfers.extend([swap.debit, swap.credit])
+            results[index] = SwapBatchResult(index, swap=swap)
+            settled.append(strategy_names[index])
+
+        await apply_balance_increments(self.db, deltas)
+        await insert_transfers(self.db, transfers)
+        after_commit(self.db, lambda: _count_swaps(settled, "ok"))
+        after_rollback(self.db, lambda: _count_swaps(settled, "failed"))
+
+        return results
+
+def _count_swaps(strategy_names: List[str], outcome: str) -> None:
+    for strategy_name in strategy_names:
+        SWAPS.inc(strategy_name, outcome)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, DateTime, String
+from sqlalchemy.dialects.postgresql import JSONB
+from infrastructure.psql.db import Base
+
+class IdempotencyRecord(Base):
+    """Response stored for an Idempotency-Key, written in the same transaction as the request's effects."""
+
+    __tablename__ = "idempotency_record"
+
+    key = Column(String(255), primary_key=True)
+    endpoint = Column(String, nullable=False)
+    fingerprint = Column(String(64), nullable=False)
+    response = Column(JSONB, nullable=True)
+    created_at = Column(DateTime, nullable=False)
@@ -1,23 +1,33 @@
 import uuid
-from sqlalchemy import Column, String, DateTime
+from decimal import Decimal
+from sqlalchemy import Column, String, DateTime, Index, Numeric
 from sqlalchemy.dialects.postgresql import UUID
 from typing import Dict
 from infrastructure.psql.db import Base
 
 class Transfer(Base):
     __tablename__ = "transfer"
+    __table_args__ = (
+        # Serves keyset-paginated history: WHERE user_id = ? ORDER BY created_at DESC, id DESC
+        Index("ix_transfer_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_transfer_reference", "reference"),
+        # Monthly range partitions, see infrastructure/psql/partitions.py.
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     type = Column(String, nullable=False)
     user_id = Column(UUID(as_uuid=True), nullable=False)
     status = Column(String, nullable=False)
     reference = Column(String, nullable=True)
-    created_at = Column(DateTime, nullable=False)
-    amount = Column(String, nullable=False)
+    # Part of the primary key because Postgres requires the partition key in every unique index.
+    created_at = Column(DateTime, primary_key=True, nullable=False)
+    amount = Column(Numeric(precision=18, scale=8), nullable=False)
     currency = Column(String, nullable=False)
     
 
-    def __init__(self, type: str, user_id: str, status: str, reference: str = None, created_at: str = None, amount: str = None, currency: str = None):
+    def __init__(self, type: str, user_id: str, status: str, reference: str = None, created_at: str = None, amount: Decimal = None, currency: str = None):
+        self.id = uuid.uuid4()
         self.type = type
         self.user_id = user_id
         self.status = status
@@ -0,0 +1,26 @@
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+
+@dataclass(frozen=True)
+class Quote:
+    """A priced swap offer that can be executed until `expires_at` (epoch seconds)."""
+
+    id: str
+    currency: str
+    target_currency: str
+    amount: Decimal
+    rate: Decimal
+    converted_amount: Decimal
+    expires_at: float
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) >= self.expires_at
+
+    def matches(self, currency: str, target_currency: str, amount: Decimal) -> bool:
+        return (
+            self.currency == currency
+            and self.target_currency == target_currency
+            and self.amount == Decimal(str(amount))
+        )
@@ -0,0 +1,58 @@
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+@dataclass(frozen=True)
+class RateSnapshot:
+    """
+    Immutable matrix of exchange rates between every pair of supported currencies.
+
+    `rates[(from, to)]` is how many units of `to` one unit of `from` buys, so
+    looking up any pair (including inverses and crosses) is a single dict access.
+    """
+
+    rates: Mapping[Tuple[str, str], Decimal]
+    fetched_at: float = field(default_factory=time.time)
+
+    def __post_init__(self):
+        object.__setattr__(self, "rates", MappingProxyType(dict(self.rates)))
+
+    @classmethod
+    def from_usd_prices(
+        cls,
+        usd_prices: Mapping[str, Decimal],
+        fetched_at: Optional[float] = None,
+        direct_rates: Optional[Mapping[Tuple[str, str], Decimal]] = None,
+    ) -> "RateSnapshot":
+        """
+        Builds every pair from the USD price of each currency.
+
+        A cross rate is one `Decimal` division of two USD prices at the default
+        28 significant digits, so besides the upstream rounding of each USD
+        price it is rounded once more. Pairs the provider quotes directly (such
+        as BTC/ETH) go in `direct_rates` and replace the derived rate.
+        """
+        rates = {}
+        for from_currency, from_price in usd_prices.items():
+            for to_currency, to_price in usd_prices.items():
+                if from_currency == to_currency:
+                    continue
+                # Division can yield exponent notation (4E+2); keep rates in plain form.
+                rates[(from_currency, to_currency)] = Decimal(format(from_price / to_price, "f"))
+        for pair, rate in (direct_rates or {}).items():
+            rates[pair] = Decimal(format(rate, "f"))
+
+        if fetched_at is None:
+            return cls(rates=rates)
+        return cls(rates=rates, fetched_at=fetched_at)
+
+    def rate(self, from_currency: str, to_currency: str) -> Decimal:
+        try:
+            return self.rates[(from_currency, to_currency)]
+        except KeyError:
+            raise ValueError(f"Unsupported currency pair: {from_currency} -> {to_currency}")
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (time.time() if now is None else now) - self.fetched_at
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
+
+from source.transfer.domain.value_objects.rate_snapshot import RateSnapshot
+from source.common_types import CurrencyType
+
+class TestRateSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        # 1 BTC = 40000 USD, 1 ETH = 2000 USD, 1 USD = 400 ARS
+        self.snapshot = RateSnapshot.from_usd_prices({
+            "USD": Decimal("1"),
+            "ARS": Decimal("0.0025"),
+            "BTC": Decimal("40000"),
+            "ETH": Decimal("2000"),
+        }, fetched_at=100.0)
+
+    def test_covers_every_currency_pair(self):
+        currencies = [c.value for c in CurrencyType.valid_currencies()]
+        for from_currency in currencies:
+            for to_currency in currencies:
+                if from_currency != to_currency:
+                    self.assertGreater(self.snapshot.rate(from_currency, to_currency), 0)
+
+    def test_cross_rates(self):
+        self.assertEqual(self.snapshot.rate("BTC", "ETH"), Decimal("20"))
+        self.assertEqual(self.snapshot.rate("USD", "ARS"), Decimal("400"))
+        self.assertEqual(self.snapshot.rate("BTC", "ARS"), Decimal("16000000"))
+
+    def test_direct_rates_replace_derived_ones(self):
+        snapshot = RateSnapshot.from_usd_prices(
+            {"USD": Decimal("1"), "BTC": Decimal("40000"), "ETH": Decimal("2000")},
+            direct_rates={("BTC", "ETH"): Decimal("20.1234"), ("ETH", "BTC"): Decimal("0.0497")},
+        )
+
+        self.assertEqual(snapshot.rate("BTC", "ETH"), Decimal("20.1234"))
+        self.assertEqual(snapshot.rate("ETH", "BTC"), Decimal("0.0497"))
+        self.assertEqual(snapshot.rate("BTC", "USD"), Decimal("40000"))
+
+    def test_inverse_rates(self):
+        self.assertEqual(self.snapshot.rate("ETH", "BTC"), Decimal("0.05"))
+        self.assertEqual(self.snapshot.rate("ARS", "USD"), Decimal("0.0025"))
+
+    def test_rates_use_plain_notation(self):
+        self.assertEqual(str(self.snapshot.rate("USD", "ARS")), "400")
+        self.assertEqual(self.snapshot.rate("ARS", "BTC"), Decimal("0.0000000625"))
+
+    def test_unsupported_pair(self):
+        with self.assertRaises(ValueError) as context:
+            self.snapshot.rate("USD", "USD")
+
+        self.assertIn("Unsupported currency pair", str(context.exception))
+
+    def test_is_immutable(self):
+        with self.assertRaises(Exception):
+            self.snapshot.fetched_at = 0
+        with self.assertRaises(TypeError):
+            self.snapshot.rates[("USD", "ARS")] = Decimal("1")
+
+    def test_age(self):
+        self.assertEqual(self.snapshot.age(now=130.0), 30.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+class GroupCommitter:
+    """
+    Coalesces concurrent submissions into shared transactions.
+
+    Items submitted within `max_delay` seconds of the first pending one, up to
+    `max_batch` items, are handed to `apply` together. `apply` must commit
+    before returning one result per item; each submitter then gets its own
+    result, or the batch's exception if the shared transaction failed. Commit
+    cost is paid per batch instead of per item, so throughput grows with load.
+    """
+
+    def __init__(self, apply: Callable[[List[Any]], Awaitable[List[Any]]], max_batch: int, max_delay: float):
+        self._apply = apply
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+
+        # Shielded: a caller that goes away does not pull its item out of a
+        # batch that may already be committing.
+        return await asyncio.shield(future)
+
+    async def close(self) -> None:
+        self._flush()
+        while self._running is not None:
+            await asyncio.gather(self._running, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._running is not None or not self._pending:
+            # A running batch flushes whatever is pending once it commits.
+            return
+        batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+        self._running = asyncio.create_task(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            await self._settle(batch)
+        finally:
+            self._running = None
+            self._flush()
+
+    async def _settle(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self._apply([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.items += len(batch)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
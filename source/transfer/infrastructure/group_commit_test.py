@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+
+from source.transfer.infrastructure.group_commit import GroupCommitter
+
+class TestGroupCommitter(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.batches = []
+
+        async def apply(items):
+            self.batches.append(list(items))
+            await asyncio.sleep(0)
+            return [f"ok:{item}" for item in items]
+
+        self.apply = apply
+
+    async def test_concurrent_submissions_share_one_batch(self):
+        committer = GroupCommitter(self.apply, max_batch=100, max_delay=0.01)
+
+        results = await asyncio.gather(*(committer.submit(i) for i in range(5)))
+
+        self.assertEqual(results, [f"ok:{i}" for i in range(5)])
+        self.assertEqual(self.batches, [[0, 1, 2, 3, 4]])
+        self.assertEqual(committer.batches, 1)
+
+    async def test_full_batch_flushes_without_waiting(self):
+        committer = GroupCommitter(self.apply, max_batch=2, max_delay=60)
+
+        results = await asyncio.wait_for(asyncio.gather(*(committer.submit(i) for i in range(4))), timeout=1)
+
+        self.assertEqual(results, ["ok:0", "ok:1", "ok:2", "ok:3"])
+        self.assertEqual(self.batches, [[0, 1], [2, 3]])
+
+    async def test_one_batch_in_flight_while_the_next_collects(self):
+        in_flight = 0
+        overlap = []
+        release = asyncio.Event()
+
+        async def slow(items):
+            nonlocal in_flight
+            in_flight += 1
+            overlap.append(in_flight)
+            self.batches.append(list(items))
+            await release.wait()
+            in_flight -= 1
+            return [f"ok:{item}" for item in items]
+
+        committer = GroupCommitter(slow, max_batch=2, max_delay=0.001)
+        first = [asyncio.create_task(committer.submit(i)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        later = [asyncio.create_task(committer.submit(i)) for i in range(2, 5)]
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.batches, [[0, 1]])
+        release.set()
+        results = await asyncio.wait_for(asyncio.gather(*first, *later), timeout=1)
+
+        self.assertEqual(results, [f"ok:{i}" for i in range(5)])
+        self.assertEqual(self.batches, [[0, 1], [2, 3], [4]])
+        self.assertEqual(max(overlap), 1)
+
+    async def test_failed_commit_reaches_every_caller(self):
+        async def failing(items):
+            raise RuntimeError("connection lost")
+
+        committer = GroupCommitter(failing, max_batch=100, max_delay=0.001)
+
+        results = await asyncio.gather(committer.submit(1), committer.submit(2), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+    async def test_close_flushes_pending_items(self):
+        committer = GroupCommitter(self.apply, max_batch=100, max_delay=60)
+        pending = asyncio.create_task(committer.submit("last"))
+        await asyncio.sleep(0)
+
+        await committer.close()
+
+        self.assertEqual(await pending, "ok:last")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from dotenv import load_dotenv
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from infrastructure.psql.db import after_commit
+from source.transfer.domain.entities.idempotency_record_entity import IdempotencyRecord
+
+load_dotenv()
+
+class IdempotencyStore:
+    """
+    Replays the stored response for a repeated Idempotency-Key.
+
+    The database is the source of truth: `claim` inserts the key with
+    ON CONFLICT DO NOTHING in the request's transaction, and `save` attaches the
+    response before that transaction commits, so a key and the effects it
+    guards are committed or rolled back together. A concurrent request with the
+    same key blocks on the insert until the first one finishes and then replays
+    its response. Failed requests roll back their claim and can be retried.
+
+    A bounded LRU of committed responses in front of the table lets most
+    retries return without touching the database.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._responses: "OrderedDict[str, Tuple[str, str, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+
+    async def claim(self, db: AsyncSession, endpoint: str, key: str, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Returns the stored response for `key`, or None if this request now owns it."""
+        fingerprint = _fingerprint(request)
+
+        cached = self._responses.get(key)
+        if cached is not None:
+            self._responses.move_to_end(key)
+            self.hits += 1
+            return _replay(cached, endpoint, fingerprint)
+
+        result = await db.execute(
+            insert(IdempotencyRecord)
+            .values(key=key, endpoint=endpoint, fingerprint=fingerprint, created_at=datetime.utcnow())
+            .on_conflict_do_nothing(index_elements=[IdempotencyRecord.key])
+            .returning(IdempotencyRecord.key)
+        )
+        if result.scalar_one_or_none() is not None:
+            return None
+
+        result = await db.execute(
+            select(IdempotencyRecord.endpoint, IdempotencyRecord.fingerprint, IdempotencyRecord.response)
+            .where(IdempotencyRecord.key == key)
+        )
+        stored = tuple(result.one())
+        if stored[2] is None:
+            raise ValueError("A request with this Idempotency-Key is still in progress")
+        self._remember(key, stored)
+        return _replay(stored, endpoint, fingerprint)
+
+    async def save(self, db: AsyncSession, endpoint: str, key: str, request: Dict[str, Any], response: Dict[str, Any]) -> None:
+        await db.execute(
+            update(IdempotencyRecord)
+            .where(IdempotencyRecord.key == key)
+            .values(response=response)
+            .execution_options(synchronize_session=False)
+        )
+        stored = (endpoint, _fingerprint(request), response)
+        after_commit(db, lambda: self._remember(key, stored))
+
+    def clear(self) -> None:
+        self._responses.clear()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def _remember(self, key: str, stored: Tuple[str, str, Dict[str, Any]]) -> None:
+        self._responses[key] = stored
+        self._responses.move_to_end(key)
+        while len(self._responses) > self.max_size:
+            self._responses.popitem(last=False)
+
+def _fingerprint(request: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+
+def _replay(stored: Tuple[str, str, Dict[str, Any]], endpoint: str, fingerprint: str) -> Dict[str, Any]:
+    stored_endpoint, stored_fingerprint, response = stored
+    if stored_endpoint != endpoint or stored_fingerprint != fingerprint:
+        raise ValueError("Idempotency-Key was already used with a different request")
+    return response
+
+idempotency = IdempotencyStore(max_size=int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "10000")))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+
+from sqlalchemy.dialects import postgresql
+from infrastructure.psql import models
+from infrastructure.psql.db import AFTER_COMMIT
+from source.transfer.infrastructure.idempotency import IdempotencyStore, _fingerprint
+
+REQUEST = {"user_id": "123e4567-e89b-12d3-a456-426614174000", "amount": "10", "currency": "USD"}
+RESPONSE = {"id": "987fcdeb-51a2-43d5-b789-123456789abc", "status": "CONFIRMED"}
+
+class TestIdempotencyStore(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.store = IdempotencyStore(max_size=2)
+        self.db = MagicMock()
+        self.db.execute = AsyncMock()
+        self.db.info = {}
+
+    def _claimed(self, claimed: bool):
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = "key-1" if claimed else None
+        return result
+
+    def _stored(self, endpoint, request, response):
+        result = MagicMock()
+        result.one.return_value = (endpoint, _fingerprint(request), response)
+        return result
+
+    def _commit(self):
+        for callback in self.db.info.pop(AFTER_COMMIT, []):
+            callback()
+
+    async def test_first_request_claims_the_key(self):
+        self.db.execute.return_value = self._claimed(True)
+
+        self.assertIsNone(await self.store.claim(self.db, "deposit", "key-1", REQUEST))
+
+        sql = str(self.db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("ON CONFLICT (key) DO NOTHING", sql)
+
+    async def test_retry_replays_the_stored_response(self):
+        self.db.execute.side_effect = [self._claimed(False), self._stored("deposit", REQUEST, RESPONSE)]
+
+        self.assertEqual(await self.store.claim(self.db, "deposit", "key-1", REQUEST), RESPONSE)
+
+    async def test_saved_response_is_cached_only_after_commit(self):
+        await self.store.save(self.db, "deposit", "key-1", REQUEST, RESPONSE)
+        self.assertEqual(len(self.store), 0)
+
+        self._commit()
+        self.db.execute.reset_mock()
+
+        self.assertEqual(await self.store.claim(self.db, "deposit", "key-1", REQUEST), RESPONSE)
+        self.db.execute.assert_not_awaited()
+        self.assertEqual(self.store.hits, 1)
+
+    async def test_key_reused_with_a_different_request_is_rejected(self):
+        self.db.execute.side_effect = [self._claimed(False), self._stored("deposit", REQUEST, RESPONSE)]
+
+        with self.assertRaises(ValueError) as context:
+            await self.store.claim(self.db, "deposit", "key-1", {**REQUEST, "amount": "20"})
+
+        self.assertIn("different request", str(context.exception))
+
+    async def test_cache_is_bounded(self):
+        for key in ["key-1", "key-2", "key-3"]:
+            await self.store.save(self.db, "deposit", key, REQUEST, RESPONSE)
+        self._commit()
+
+        self.assertEqual(len(self.store), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import asyncio
+import zlib
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+class KeyedMailbox:
+    """
+    Runs operations for the same key one at a time, in submission order, while
+    different keys run in parallel.
+
+    Keys are hashed onto `shards` bounded queues, each drained by one worker
+    task, so at most `shards` operations run at once and all operations for a
+    key go through the same queue. An operation only starts (and only takes a
+    database connection) when its turn comes; callers waiting behind it hold
+    nothing. When a queue is full, submitters wait for room.
+    """
+
+    def __init__(self, shards: int, queue_size: int):
+        self.shards = shards
+        self.queue_size = queue_size
+        self._queues: List[asyncio.Queue] = []
+        self._workers: List[asyncio.Task] = []
+
+    async def run(self, key: Any, operation: Callable[[], Awaitable[Any]]) -> Any:
+        self._start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queues[self.shard(key)].put((operation, future))
+        return await future
+
+    def shard(self, key: Any) -> int:
+        return zlib.crc32(str(key).encode()) % self.shards
+
+    def queued(self) -> int:
+        return sum(queue.qsize() for queue in self._queues)
+
+    async def close(self) -> None:
+        for queue in self._queues:
+            await queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._queues, self._workers = [], []
+
+    def _start(self) -> None:
+        if self._workers:
+            return
+        self._queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(self.shards)]
+        self._workers = [asyncio.create_task(self._work(queue)) for queue in self._queues]
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        while True:
+            operation, future = await queue.get()
+            try:
+                # Callers that gave up while queued are skipped.
+                if not future.done():
+                    await self._execute(operation, future)
+            finally:
+                queue.task_done()
+
+    async def _execute(self, operation: Callable[[], Awaitable[Any]], future: asyncio.Future) -> None:
+        try:
+            result = await operation()
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(result)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+
+from source.transfer.infrastructure.keyed_mailbox import KeyedMailbox
+
+class TestKeyedMailbox(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncTearDown(self):
+        await self.mailbox.close()
+
+    def _operation(self, log, name, delay=0.0):
+        async def operation():
+            log.append(f"start {name}")
+            await asyncio.sleep(delay)
+            log.append(f"end {name}")
+            return name
+        return operation
+
+    async def test_same_key_runs_in_order_one_at_a_time(self):
+        self.mailbox = KeyedMailbox(shards=4, queue_size=10)
+        log = []
+
+        results = await asyncio.gather(
+            self.mailbox.run("alice", self._operation(log, "a1", 0.01)),
+            self.mailbox.run("alice", self._operation(log, "a2")),
+        )
+
+        self.assertEqual(results, ["a1", "a2"])
+        self.assertEqual(log, ["start a1", "end a1", "start a2", "end a2"])
+
+    async def test_different_shards_run_in_parallel(self):
+        self.mailbox = KeyedMailbox(shards=64, queue_size=10)
+        bob = next(key for key in (f"user-{i}" for i in range(100)) if self.mailbox.shard(key) != self.mailbox.shard("alice"))
+        log = []
+
+        await asyncio.gather(
+            self.mailbox.run("alice", self._operation(log, "alice", 0.01)),
+            self.mailbox.run(bob, self._operation(log, "bob", 0.01)),
+        )
+
+        self.assertEqual(set(log[:2]), {"start alice", "start bob"})
+
+    async def test_errors_reach_the_caller_and_the_queue_keeps_going(self):
+        self.mailbox = KeyedMailbox(shards=1, queue_size=10)
+
+        async def failing():
+            raise ValueError("Insufficient balance.")
+
+        with self.assertRaises(ValueError):
+            await self.mailbox.run("alice", failing)
+
+        self.assertEqual(await self.mailbox.run("alice", self._operation([], "next")), "next")
+
+    async def test_cancelled_caller_is_skipped(self):
+        self.mailbox = KeyedMailbox(shards=1, queue_size=10)
+        log = []
+
+        first = asyncio.create_task(self.mailbox.run("alice", self._operation(log, "first", 0.01)))
+        second = asyncio.create_task(self.mailbox.run("alice", self._operation(log, "second")))
+        await asyncio.sleep(0)
+        second.cancel()
+        await first
+
+        await self.mailbox.run("alice", self._operation(log, "third"))
+        self.assertNotIn("start second", log)
+
+if __name__ == "__main__":
+    unittest.main()
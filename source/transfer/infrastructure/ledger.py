@@ -0,0 +1,17 @@
+from typing import List
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from source.transfer.domain.entities.transfer_entity import Transfer
+
+async def insert_transfers(db: AsyncSession, transfers: List[Transfer]) -> None:
+    """
+    Writes ledger rows with a single executemany INSERT, which asyncpg sends as
+    one pipelined batch. Ids are generated client-side.
+    """
+    if not transfers:
+        return
+    rows = [
+        {column.key: getattr(transfer, column.key) for column in Transfer.__table__.columns}
+        for transfer in transfers
+    ]
+    await db.execute(insert(Transfer), rows)
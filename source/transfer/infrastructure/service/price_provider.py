@@ -1,62 +1,202 @@
+import asyncio
+import logging
 import os
 from decimal import Decimal
+from typing import Dict, Optional, Tuple
 import aiohttp
 from dotenv import load_dotenv
+from infrastructure.metrics import UPSTREAM_ERRORS, UPSTREAM_SECONDS
+from source.common_types.currency_types import CurrencyType
+from source.transfer.domain.value_objects.rate_snapshot import RateSnapshot
+from source.transfer.infrastructure.service.rate_cache import RateCache
+from source.transfer.infrastructure.service.rate_refresher import RateRefresher
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 class PriceProvider:
     COINGECKO_URL = os.getenv("COINGECKO_API_URL", "https://api.coingecko.com/api/v3")
     DOLAR_API_URL = os.getenv("DOLAR_API_URL", "https://dolarapi.com/v1")
 
-    @staticmethod
-    async def get_crypto_rate(from_currency: str, to_currency: str) -> Decimal:
-        FROM_COINGECKO_IDS = {
-            "BTC": "bitcoin",
-            "ETH": "ethereum",
-            "USD": "usd"
-        }
-        
-        TO_COINGECKO_IDS = {
-            "BTC": "btc",
-            "ETH": "eth",
-            "USD": "usd"
+    COINGECKO_IDS = {
+        CurrencyType.BTC.value: "bitcoin",
+        CurrencyType.ETH.value: "ethereum",
+    }
+    SNAPSHOT_KEY = "rate_snapshot"
+    # Metric labels for the pairs each upstream call prices.
+    COINGECKO_PAIRS = "BTC/USD,ETH/USD,BTC/ETH"
+    DOLAR_API_PAIRS = "USD/ARS"
+
+    CONNECT_TIMEOUT = float(os.getenv("PRICE_PROVIDER_CONNECT_TIMEOUT", "2"))
+    READ_TIMEOUT = float(os.getenv("PRICE_PROVIDER_READ_TIMEOUT", "5"))
+    POOL_LIMIT = int(os.getenv("PRICE_PROVIDER_POOL_LIMIT", "100"))
+    POOL_LIMIT_PER_HOST = int(os.getenv("PRICE_PROVIDER_POOL_LIMIT_PER_HOST", "20"))
+    KEEPALIVE_TIMEOUT = float(os.getenv("PRICE_PROVIDER_KEEPALIVE_TIMEOUT", "30"))
+
+    RATE_CACHE_MAX_AGE = float(os.getenv("RATE_CACHE_MAX_AGE", "10"))
+    RATE_CACHE_MAX_STALENESS = float(os.getenv("RATE_CACHE_MAX_STALENESS", "60"))
+    RATE_REFRESH_INTERVAL = float(os.getenv("RATE_REFRESH_INTERVAL", "5"))
+
+    _session: Optional[aiohttp.ClientSession] = None
+    _cache = RateCache(max_age=RATE_CACHE_MAX_AGE, max_staleness=RATE_CACHE_MAX_STALENESS)
+    _snapshot: Optional[RateSnapshot] = None
+    _refresher: Optional[RateRefresher] = None
+
+    @classmethod
+    async def start(cls) -> None:
+        # One pooled session for the whole app lifespan, so rate lookups reuse
+        # keep-alive connections instead of paying DNS + TCP + TLS on every swap.
+        if cls._session is not None and not cls._session.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=cls.POOL_LIMIT,
+            limit_per_host=cls.POOL_LIMIT_PER_HOST,
+            keepalive_timeout=cls.KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=300,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=cls.CONNECT_TIMEOUT,
+            sock_read=cls.READ_TIMEOUT,
+        )
+        cls._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        if cls._session is None or cls._session.closed:
+            await cls.start()
+        return cls._session
+
+    @classmethod
+    def start_refresher(cls) -> None:
+        if cls.RATE_REFRESH_INTERVAL <= 0:
+            return
+        if cls._refresher is None:
+            cls._refresher = RateRefresher(
+                interval=cls.RATE_REFRESH_INTERVAL,
+                fetch=cls._fetch_rate_snapshot,
+                publish=cls.publish_snapshot,
+                current=lambda: cls._snapshot,
+            )
+        cls._refresher.start()
+
+    @classmethod
+    async def stop_refresher(cls) -> None:
+        if cls._refresher is not None:
+            await cls._refresher.stop()
+
+    @classmethod
+    def publish_snapshot(cls, snapshot: RateSnapshot) -> None:
+        cls._snapshot = snapshot
+
+    @classmethod
+    def rate_stats(cls) -> dict:
+        snapshot = cls._snapshot
+        refresher = cls._refresher
+        return {
+            "snapshot_age_seconds": round(snapshot.age(), 3) if snapshot is not None else None,
+            "refresher": {
+                "running": refresher.running,
+                "interval": refresher.interval,
+                "refreshes": refresher.refreshes,
+                "failures": refresher.failures,
+            } if refresher is not None else None,
+            "cache": cls._cache.stats(),
         }
-        
+
+    @classmethod
+    async def get_rate_snapshot(cls) -> RateSnapshot:
+        # The refresher keeps a published snapshot current, so the request path
+        # never waits on upstream. If it is missing or has stalled past the max
+        # staleness, fall back to fetching through the cache.
+        snapshot = cls._snapshot
+        if snapshot is not None:
+            if snapshot.age() <= cls.RATE_CACHE_MAX_STALENESS:
+                return snapshot
+            logger.warning(f"Published rate snapshot is {snapshot.age():.1f}s old; fetching rates on the request path")
+        return await cls._cache.get(cls.SNAPSHOT_KEY, cls._fetch_rate_snapshot)
+
+    @classmethod
+    async def _fetch_rate_snapshot(cls) -> RateSnapshot:
+        # One crypto call and one fiat call price every currency in USD; crypto
+        # pairs CoinGecko quotes directly are used as-is and every other pair is
+        # derived from the USD prices.
+        (crypto_prices, crypto_rates), ars_per_usd = await asyncio.gather(
+            cls._fetch_crypto_prices(),
+            cls._fetch_ars_per_usd(),
+        )
+
+        usd_prices = {CurrencyType.USD.value: Decimal("1"), CurrencyType.ARS.value: Decimal("1") / ars_per_usd}
+        usd_prices.update(crypto_prices)
+        return RateSnapshot.from_usd_prices(usd_prices, direct_rates=crypto_rates)
+
+    @classmethod
+    async def _fetch_crypto_prices(cls) -> Tuple[Dict[str, Decimal], Dict[Tuple[str, str], Decimal]]:
+        with UPSTREAM_SECONDS.time("coingecko", cls.COINGECKO_PAIRS):
+            try:
+                return await cls._get_crypto_prices()
+            except ValueError:
+                UPSTREAM_ERRORS.inc("coingecko", cls.COINGECKO_PAIRS)
+                raise
+
+    @classmethod
+    async def _get_crypto_prices(cls) -> Tuple[Dict[str, Decimal], Dict[Tuple[str, str], Decimal]]:
+        """Returns the USD price of each crypto and the crypto pairs CoinGecko quotes directly."""
         try:
-            async with aiohttp.ClientSession() as session:
-                from_id = FROM_COINGECKO_IDS[from_currency]
-                to_id = TO_COINGECKO_IDS[to_currency]
-                url = f"{PriceProvider.COINGECKO_URL}/simple/price?ids={from_id}&vs_currencies={to_id}"
-                
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise ValueError("Failed to fetch exchange rate from CoinGecko")
-                    
-                    data = await response.json()
-                    
-                    return Decimal(str(data[from_id][to_id]))
-        
+            session = await cls._get_session()
+            ids = ",".join(cls.COINGECKO_IDS.values())
+            vs_currencies = ",".join(["usd"] + [currency.lower() for currency in cls.COINGECKO_IDS])
+            url = f"{cls.COINGECKO_URL}/simple/price?ids={ids}&vs_currencies={vs_currencies}"
+
+            async with session.get(url) as response:
+                if response.status != 200:
+                    raise ValueError("Failed to fetch exchange rate from CoinGecko")
+
+                data = await response.json()
+
+                usd_prices = {
+                    currency: Decimal(str(data[coingecko_id]["usd"]))
+                    for currency, coingecko_id in cls.COINGECKO_IDS.items()
+                }
+                # A missing direct quote falls back to the rate derived through USD.
+                direct_rates = {
+                    (currency, quote): Decimal(str(data[coingecko_id][quote.lower()]))
+                    for currency, coingecko_id in cls.COINGECKO_IDS.items()
+                    for quote in cls.COINGECKO_IDS
+                    if quote != currency and data[coingecko_id].get(quote.lower())
+                }
+                return usd_prices, direct_rates
+
         except Exception as e:
             raise ValueError(f"Error fetching crypto exchange rate: {str(e)}")
-    
-    @staticmethod
-    async def get_fiat_rate(from_currency: str, to_currency: str) -> Decimal:
+
+    @classmethod
+    async def _fetch_ars_per_usd(cls) -> Decimal:
+        with UPSTREAM_SECONDS.time("dolarapi", cls.DOLAR_API_PAIRS):
+            try:
+                return await cls._get_ars_per_usd()
+            except ValueError:
+                UPSTREAM_ERRORS.inc("dolarapi", cls.DOLAR_API_PAIRS)
+                raise
+
+    @classmethod
+    async def _get_ars_per_usd(cls) -> Decimal:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{PriceProvider.DOLAR_API_URL}/dolares/blue") as response:
-                    if response.status != 200:
-                        raise ValueError("Failed to fetch exchange rate from DolarAPI")
-                    
-                    data = await response.json()
-                    venta_rate = Decimal(str(data["venta"]))
-                    
-                    if from_currency == "ARS" and to_currency == "USD":
-                        return Decimal("1") / venta_rate
-                    elif from_currency == "USD" and to_currency == "ARS":
-                        return venta_rate
-                    else:
-                        raise ValueError(f"Unsupported currency pair: {from_currency} -> {to_currency}")
-        
+            session = await cls._get_session()
+            async with session.get(f"{cls.DOLAR_API_URL}/dolares/blue") as response:
+                if response.status != 200:
+                    raise ValueError("Failed to fetch exchange rate from DolarAPI")
+
+                data = await response.json()
+                return Decimal(str(data["venta"]))
+
         except Exception as e:
-            raise ValueError(f"Error fetching exchange rate: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error fetching exchange rate: {str(e)}")
@@ -0,0 +1,76 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Set
+from dotenv import load_dotenv
+from source.transfer.domain.value_objects.quote import Quote
+
+load_dotenv()
+
+class QuoteStore:
+    """
+    Bounded in-memory store of open quotes.
+
+    Quotes are kept in insertion order, which is also expiry order since they all
+    share the same TTL, so expired quotes are evicted from the front. When the
+    store is full the oldest quote is dropped.
+
+    A swap reserves its quote while its transaction is open and takes it once
+    committed, or releases it on rollback so the client can retry.
+    """
+
+    def __init__(self, max_size: int, ttl: float, clock: Callable[[], float] = time.time):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._quotes: "OrderedDict[str, Quote]" = OrderedDict()
+        self._reserved: Set[str] = set()
+
+    def expiry(self) -> float:
+        return self._clock() + self.ttl
+
+    def put(self, quote: Quote) -> None:
+        self._evict_expired()
+        while len(self._quotes) >= self.max_size:
+            self._quotes.popitem(last=False)
+        self._quotes[quote.id] = quote
+
+    def get(self, quote_id: str) -> Optional[Quote]:
+        quote = self._quotes.get(quote_id)
+        if quote is None or quote.is_expired(self._clock()):
+            return None
+        return quote
+
+    def reserve(self, quote_id: str) -> bool:
+        """Marks a live quote as being settled; False if it is gone or already reserved."""
+        if quote_id in self._reserved or self.get(quote_id) is None:
+            return False
+        self._reserved.add(quote_id)
+        return True
+
+    def release(self, quote_id: str) -> None:
+        self._reserved.discard(quote_id)
+
+    def take(self, quote_id: str) -> Optional[Quote]:
+        """Removes and returns a live quote, so each quote settles at most one swap."""
+        self._reserved.discard(quote_id)
+        quote = self._quotes.pop(quote_id, None)
+        if quote is None or quote.is_expired(self._clock()):
+            return None
+        return quote
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def _evict_expired(self) -> None:
+        now = self._clock()
+        while self._quotes:
+            oldest = next(iter(self._quotes.values()))
+            if not oldest.is_expired(now):
+                break
+            self._quotes.popitem(last=False)
+
+quote_store = QuoteStore(
+    max_size=int(os.getenv("QUOTE_STORE_MAX_SIZE", "10000")),
+    ttl=float(os.getenv("QUOTE_TTL", "30")),
+)
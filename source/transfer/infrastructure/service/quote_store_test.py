@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
+
+from source.transfer.infrastructure.service.quote_store import QuoteStore
+from source.transfer.domain.value_objects.quote import Quote
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class TestQuoteStore(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.store = QuoteStore(max_size=3, ttl=30, clock=self.clock)
+
+    def _quote(self, quote_id: str) -> Quote:
+        return Quote(
+            id=quote_id,
+            currency="USD",
+            target_currency="ARS",
+            amount=Decimal("100"),
+            rate=Decimal("400"),
+            converted_amount=Decimal("40000"),
+            expires_at=self.store.expiry(),
+        )
+
+    def test_get_live_quote(self):
+        self.store.put(self._quote("q1"))
+
+        self.assertEqual(self.store.get("q1").rate, Decimal("400"))
+
+    def test_expired_quote_is_not_returned(self):
+        self.store.put(self._quote("q1"))
+        self.clock.now += 30
+
+        self.assertIsNone(self.store.get("q1"))
+        self.assertIsNone(self.store.take("q1"))
+
+    def test_take_is_single_use(self):
+        self.store.put(self._quote("q1"))
+
+        self.assertIsNotNone(self.store.take("q1"))
+        self.assertIsNone(self.store.take("q1"))
+
+    def test_reservation_is_exclusive_until_released(self):
+        self.store.put(self._quote("q1"))
+
+        self.assertTrue(self.store.reserve("q1"))
+        self.assertFalse(self.store.reserve("q1"))
+        self.store.release("q1")
+        self.assertTrue(self.store.reserve("q1"))
+        self.assertIsNotNone(self.store.take("q1"))
+        self.assertFalse(self.store.reserve("q1"))
+
+    def test_oldest_quote_evicted_when_full(self):
+        for quote_id in ["q1", "q2", "q3", "q4"]:
+            self.store.put(self._quote(quote_id))
+
+        self.assertEqual(len(self.store), 3)
+        self.assertIsNone(self.store.get("q1"))
+        self.assertIsNotNone(self.store.get("q4"))
+
+    def test_expired_quotes_evicted_on_put(self):
+        self.store.put(self._quote("q1"))
+        self.store.put(self._quote("q2"))
+        self.clock.now += 31
+        self.store.put(self._quote("q3"))
+
+        self.assertEqual(len(self.store), 1)
+
+    def test_quote_matches_swap(self):
+        quote = self._quote("q1")
+
+        self.assertTrue(quote.matches("USD", "ARS", "100"))
+        self.assertFalse(quote.matches("USD", "ARS", "101"))
+        self.assertFalse(quote.matches("ARS", "USD", "100"))
+
+if __name__ == "__main__":
+    unittest.main()
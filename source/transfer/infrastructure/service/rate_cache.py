@@ -0,0 +1,92 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, Any
+from source.transfer.infrastructure.service.single_flight import SingleFlight
+
+class RateCache:
+    """
+    In-process cache for exchange rates, keyed by currency pair or snapshot.
+
+    Values younger than `max_age` are served as hits. Values older than that but
+    within `max_staleness` are served as stale while a single background refresh
+    runs. Past `max_staleness` the value is no longer served: callers wait for a
+    fresh fetch and get a ValueError if it fails.
+
+    Concurrent fetches for the same key are coalesced, so a burst of misses for
+    one pair results in a single upstream request.
+    """
+
+    def __init__(self, max_age: float, max_staleness: float, clock: Callable[[], float] = time.monotonic):
+        if max_staleness < max_age:
+            raise ValueError("max_staleness must be greater than or equal to max_age")
+        self.max_age = max_age
+        self.max_staleness = max_staleness
+        self._clock = clock
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, fetched_at = entry
+            age = self._clock() - fetched_at
+            if age <= self.max_age:
+                self.hits += 1
+                return value
+            if age <= self.max_staleness:
+                self.stale += 1
+                self._schedule_refresh(key, fetch)
+                return value
+
+        self.misses += 1
+        try:
+            return await self._fetch(key, fetch)
+        except ValueError:
+            if entry is not None:
+                raise ValueError("Exchange rate is too stale and could not be refreshed")
+            raise
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (value, self._clock())
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "entries": len(self._entries),
+            "refreshing": len(self._refreshing),
+            "in_flight": self._flight.in_flight(),
+            "coalesced": self._flight.coalesced,
+            "max_age": self.max_age,
+            "max_staleness": self.max_staleness,
+        }
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        return await self._flight.do(key, lambda: self._fetch_and_store(key, fetch))
+
+    async def _fetch_and_store(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = await fetch()
+        self.set(key, value)
+        return value
+
+    def _schedule_refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._fetch(key, fetch))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda t: self._on_refreshed(key, t))
+
+    def _on_refreshed(self, key: Hashable, task: asyncio.Task) -> None:
+        self._refreshing.pop(key, None)
+        if not task.cancelled():
+            # A failed refresh keeps the stale value until max_staleness is reached.
+            task.exception()
+
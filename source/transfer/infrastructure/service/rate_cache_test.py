@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+import unittest
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
+
+from source.transfer.infrastructure.service.rate_cache import RateCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestRateCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = RateCache(max_age=10, max_staleness=60, clock=self.clock)
+
+    async def _settle_refreshes(self):
+        for _ in range(10):
+            if self.cache.stats()["refreshing"] == 0:
+                return
+            await asyncio.sleep(0)
+
+    async def test_miss_then_hit(self):
+        fetch = AsyncMock(return_value=Decimal("350"))
+
+        first = await self.cache.get(("USD", "ARS"), fetch)
+        second = await self.cache.get(("USD", "ARS"), fetch)
+
+        self.assertEqual(first, Decimal("350"))
+        self.assertEqual(second, Decimal("350"))
+        fetch.assert_awaited_once()
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    async def test_stale_value_served_while_refreshing(self):
+        await self.cache.get(("USD", "ARS"), AsyncMock(return_value=Decimal("350")))
+        self.clock.now = 30
+
+        refresh = AsyncMock(return_value=Decimal("360"))
+        stale = await self.cache.get(("USD", "ARS"), refresh)
+        again = await self.cache.get(("USD", "ARS"), refresh)
+
+        self.assertEqual(stale, Decimal("350"))
+        self.assertEqual(again, Decimal("350"))
+        self.assertEqual(self.cache.stale, 2)
+
+        await self._settle_refreshes()
+        refresh.assert_awaited_once()
+        self.assertEqual(await self.cache.get(("USD", "ARS"), refresh), Decimal("360"))
+
+    async def test_failed_refresh_keeps_stale_value(self):
+        await self.cache.get(("USD", "ARS"), AsyncMock(return_value=Decimal("350")))
+        self.clock.now = 30
+
+        failing = AsyncMock(side_effect=ValueError("upstream down"))
+        self.assertEqual(await self.cache.get(("USD", "ARS"), failing), Decimal("350"))
+        await self._settle_refreshes()
+
+        self.assertEqual(await self.cache.get(("USD", "ARS"), failing), Decimal("350"))
+
+    async def test_refuses_value_past_max_staleness(self):
+        await self.cache.get(("USD", "ARS"), AsyncMock(return_value=Decimal("350")))
+        self.clock.now = 61
+
+        with self.assertRaises(ValueError) as context:
+            await self.cache.get(("USD", "ARS"), AsyncMock(side_effect=ValueError("upstream down")))
+
+        self.assertIn("too stale", str(context.exception))
+
+    async def test_miss_without_entry_propagates_error(self):
+        with self.assertRaises(ValueError) as context:
+            await self.cache.get(("BTC", "USD"), AsyncMock(side_effect=ValueError("upstream down")))
+
+        self.assertEqual(str(context.exception), "upstream down")
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            RateCache(max_age=60, max_staleness=10)
+
+if __name__ == "__main__":
+    unittest.main()
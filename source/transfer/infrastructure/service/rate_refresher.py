@@ -0,0 +1,64 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+from source.transfer.domain.value_objects.rate_snapshot import RateSnapshot
+
+logger = logging.getLogger(__name__)
+
+class RateRefresher:
+    """
+    Background task that polls the upstream providers every `interval` seconds
+    and publishes each new RateSnapshot. Readers only ever see whole snapshots,
+    since publishing is a single reference swap.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        fetch: Callable[[], Awaitable[RateSnapshot]],
+        publish: Callable[[RateSnapshot], None],
+        current: Callable[[], Optional[RateSnapshot]],
+    ):
+        self.interval = interval
+        self._fetch = fetch
+        self._publish = publish
+        self._current = current
+        self._task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+        self.failures = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def refresh_once(self) -> None:
+        try:
+            snapshot = await self._fetch()
+        except Exception as e:
+            self.failures += 1
+            current = self._current()
+            age = f"{current.age():.1f}s" if current is not None else "n/a"
+            logger.warning(f"Rate refresh failed ({e}); current snapshot age: {age}")
+            return
+
+        self._publish(snapshot)
+        self.refreshes += 1
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh_once()
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+import unittest
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
+
+from source.transfer.infrastructure.service.rate_refresher import RateRefresher
+from source.transfer.domain.value_objects.rate_snapshot import RateSnapshot
+
+class TestRateRefresher(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.published = []
+        self.snapshot = RateSnapshot({("USD", "ARS"): Decimal("400")})
+
+    def _refresher(self, fetch):
+        return RateRefresher(
+            interval=0.01,
+            fetch=fetch,
+            publish=self.published.append,
+            current=lambda: self.published[-1] if self.published else None,
+        )
+
+    async def test_refresh_publishes_snapshot(self):
+        refresher = self._refresher(AsyncMock(return_value=self.snapshot))
+
+        await refresher.refresh_once()
+
+        self.assertEqual(self.published, [self.snapshot])
+        self.assertEqual(refresher.refreshes, 1)
+
+    async def test_failed_refresh_keeps_current_snapshot(self):
+        self.published.append(self.snapshot)
+        refresher = self._refresher(AsyncMock(side_effect=ValueError("upstream down")))
+
+        with self.assertLogs("source.transfer.infrastructure.service.rate_refresher", level="WARNING") as logs:
+            await refresher.refresh_once()
+
+        self.assertEqual(self.published, [self.snapshot])
+        self.assertEqual(refresher.failures, 1)
+        self.assertIn("snapshot age", logs.output[0])
+
+    async def test_runs_until_stopped(self):
+        fetch = AsyncMock(return_value=self.snapshot)
+        refresher = self._refresher(fetch)
+
+        refresher.start()
+        await asyncio.sleep(0.05)
+        await refresher.stop()
+
+        self.assertFalse(refresher.running)
+        self.assertGreaterEqual(fetch.await_count, 2)
+
+if __name__ == "__main__":
+    unittest.main()
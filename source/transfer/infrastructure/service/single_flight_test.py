@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import asyncio
+import unittest
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
+
+from source.transfer.infrastructure.service.single_flight import SingleFlight
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.flight = SingleFlight()
+        self.calls = 0
+
+    async def _slow_rate(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return Decimal("45000")
+
+    async def test_concurrent_calls_share_one_fetch(self):
+        results = await asyncio.gather(*[
+            self.flight.do(("BTC", "USD"), self._slow_rate) for _ in range(50)
+        ])
+
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(r == Decimal("45000") for r in results))
+        self.assertEqual(self.flight.coalesced, 49)
+        self.assertEqual(self.flight.in_flight(), 0)
+
+    async def test_different_keys_are_not_coalesced(self):
+        await asyncio.gather(
+            self.flight.do(("BTC", "USD"), self._slow_rate),
+            self.flight.do(("ETH", "USD"), self._slow_rate),
+        )
+
+        self.assertEqual(self.calls, 2)
+
+    async def test_sequential_calls_fetch_again(self):
+        await self.flight.do(("BTC", "USD"), self._slow_rate)
+        await self.flight.do(("BTC", "USD"), self._slow_rate)
+
+        self.assertEqual(self.calls, 2)
+
+    async def test_error_is_shared_by_waiters(self):
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+
+        results = await asyncio.gather(
+            self.flight.do("pair", failing),
+            self.flight.do("pair", failing),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(self.flight.in_flight(), 0)
+
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self):
+        first = asyncio.ensure_future(self.flight.do("pair", self._slow_rate))
+        second = asyncio.ensure_future(self.flight.do("pair", self._slow_rate))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, Decimal("45000"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,9 @@
 from fastapi import APIRouter
 from source.user.application.use_cases.create_user.controller import create_user
+from source.user.application.use_cases.create_users_batch.controller import create_users_batch
+from source.user.application.use_cases.get_balances.controller import get_balances
 
 router = APIRouter(prefix="/users", tags=["users"])
-router.add_api_route("", create_user, methods=["POST"])
\ No newline at end of file
+router.add_api_route("", create_user, methods=["POST"])
+router.add_api_route("/batch", create_users_batch, methods=["POST"])
+router.add_api_route("/{user_id}/balances", get_balances, methods=["GET"])
\ No newline at end of file
@@ -2,15 +2,20 @@ from typing import Dict
 from source.user.domain.entities.user_entity import User
 from source.user.domain.services.user_factory import create_user
 from sqlalchemy.ext.asyncio import AsyncSession
+from infrastructure.psql.db import after_commit
+from infrastructure.psql.replica import recent_writes
+from infrastructure.metrics import USE_CASE_SECONDS, timed
 
 class CreateUserUseCase:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @timed(USE_CASE_SECONDS, "CreateUserUseCase")
     async def execute(self, name: str) -> User:
         user = create_user(name)
         self.db.add(user)
-        await self.db.commit()
+        # The new user's balances only exist on the primary until the replica catches up.
+        after_commit(self.db, lambda: recent_writes.record(user.id))
 
         print(f"user: {user}")
         return user
\ No newline at end of file
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Bulk-creates users from a file with one name per line (or stdin).
+
+Writes "id,name" for every created user to stdout and progress to stderr:
+
+    python source/user/application/use_cases/create_users_batch/cli.py names.txt > users.csv
+"""
+
+import sys
+import os
+import asyncio
+import argparse
+import csv
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../')))
+
+from infrastructure.psql import models
+from infrastructure.psql.db import engine
+from source.user.application.use_cases.create_users_batch.use_case import CreateUsersBatchUseCase, USER_BATCH_CHUNK_SIZE
+
+def read_names(source):
+    for line in source:
+        name = line.strip()
+        if name:
+            yield name
+
+async def run(source, chunk_size: int) -> int:
+    writer = csv.writer(sys.stdout)
+    created = 0
+    try:
+        async for users in CreateUsersBatchUseCase(chunk_size=chunk_size).execute(read_names(source)):
+            writer.writerows((str(user.id), user.name) for user in users)
+            created += len(users)
+            print(f"created {created} users", file=sys.stderr)
+    finally:
+        await engine.dispose()
+    return created
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-create users with their balances")
+    parser.add_argument("file", nargs="?", help="File with one user name per line (default: stdin)")
+    parser.add_argument("--chunk-size", type=int, default=USER_BATCH_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file) as source:
+            asyncio.run(run(source, args.chunk_size))
+    else:
+        asyncio.run(run(sys.stdin, args.chunk_size))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import json
+import os
+from typing import AsyncIterator, List
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from source.user.application.use_cases.create_users_batch.use_case import CreateUsersBatchUseCase
+
+USER_BATCH_MAX_SIZE = int(os.getenv("USER_BATCH_MAX_SIZE", "50000"))
+
+class CreateUsersBatchRequest(BaseModel):
+    names: List[str] = Field(min_length=1, max_length=USER_BATCH_MAX_SIZE)
+
+async def create_users_batch(request: CreateUsersBatchRequest):
+    # Chunks commit on their own while the response streams, so the request
+    # session from get_db is not used here.
+    return StreamingResponse(_progress(request.names), media_type="application/x-ndjson")
+
+async def _progress(names: List[str]) -> AsyncIterator[str]:
+    created = 0
+    try:
+        async for users in CreateUsersBatchUseCase().execute(names):
+            created += len(users)
+            yield json.dumps({
+                "created": created,
+                "total": len(names),
+                "users": [{"id": str(user.id), "name": user.name} for user in users],
+            }) + "\n"
+    except Exception as e:
+        # Headers are already sent; report the failure in-band.
+        yield json.dumps({"created": created, "total": len(names), "error": str(e)}) + "\n"
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../')))
+
+from infrastructure.psql import models
+from source.user.application.use_cases.create_users_batch.use_case import CreateUsersBatchUseCase
+
+class FakeUnitOfWork:
+    def __init__(self, log):
+        self.session = MagicMock()
+        self.session.execute = AsyncMock()
+        self.log = log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.log.append((self.session, exc_type is None))
+
+class TestCreateUsersBatchUseCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.commits = []
+        self.use_case = CreateUsersBatchUseCase(unit_of_work=lambda: FakeUnitOfWork(self.commits), chunk_size=2)
+
+    async def test_writes_each_chunk_in_its_own_transaction(self):
+        chunks = [users async for users in self.use_case.execute(["ana", "bruno", "carla", "diego", "eva"])]
+
+        self.assertEqual([len(users) for users in chunks], [2, 2, 1])
+        self.assertEqual(len(self.commits), 3)
+        self.assertTrue(all(committed for _, committed in self.commits))
+
+    async def test_inserts_users_then_four_balances_each(self):
+        chunks = [users async for users in self.use_case.execute(["ana", "bruno"])]
+
+        session, _ = self.commits[0]
+        users_call, balances_call = session.execute.await_args_list
+        users_rows = users_call.args[1]
+        balance_rows = balances_call.args[1]
+
+        self.assertEqual([row["id"] for row in users_rows], [user.id for user in chunks[0]])
+        self.assertEqual(len(balance_rows), 8)
+        self.assertEqual({row["currency"] for row in balance_rows}, {"ARS", "USD", "BTC", "ETH"})
+        self.assertTrue(all(row["user_id"] in {user.id for user in chunks[0]} for row in balance_rows))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import os
+from typing import AsyncIterator, Callable, Iterable, List
+from infrastructure.psql.db import UnitOfWork
+from source.user.domain.entities.user_entity import User
+from source.user.domain.services.user_factory import create_user
+from source.user.infrastructure.user_writer import insert_users
+
+USER_BATCH_CHUNK_SIZE = int(os.getenv("USER_BATCH_CHUNK_SIZE", "1000"))
+
+class CreateUsersBatchUseCase:
+    """
+    Onboards users in chunks of `chunk_size`. Each chunk is written with
+    multi-row inserts and committed in its own unit of work, then yielded, so
+    callers can report progress and a failure only loses the chunk in flight.
+    """
+
+    def __init__(self, unit_of_work: Callable[[], UnitOfWork] = UnitOfWork, chunk_size: int = USER_BATCH_CHUNK_SIZE):
+        self.unit_of_work = unit_of_work
+        self.chunk_size = chunk_size
+
+    async def execute(self, names: Iterable[str]) -> AsyncIterator[List[User]]:
+        chunk = []
+        for name in names:
+            chunk.append(create_user(name))
+            if len(chunk) >= self.chunk_size:
+                yield await self._write(chunk)
+                chunk = []
+        if chunk:
+            yield await self._write(chunk)
+
+    async def _write(self, users: List[User]) -> List[User]:
+        async with self.unit_of_work() as uow:
+            await insert_users(uow.session, users)
+        return users
@@ -0,0 +1,32 @@
+import uuid
+from decimal import Decimal
+from typing import List
+from fastapi import HTTPException, Depends
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from infrastructure.psql.replica import get_read_db
+from source.common_types.currency_types import CurrencyType
+from source.user.application.use_cases.get_balances.use_case import GetBalancesUseCase
+
+class BalanceResponse(BaseModel):
+    currency: CurrencyType
+    amount: Decimal
+
+class BalancesResponse(BaseModel):
+    user_id: str
+    balances: List[BalanceResponse]
+
+async def get_balances(
+    user_id: uuid.UUID,
+    db: AsyncSession = Depends(get_read_db)
+):
+    use_case = GetBalancesUseCase(db)
+    try:
+        balances = await use_case.execute(user_id=str(user_id))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return BalancesResponse(
+        user_id=str(user_id),
+        balances=[BalanceResponse(currency=currency, amount=amount) for currency, amount in balances.items()]
+    )
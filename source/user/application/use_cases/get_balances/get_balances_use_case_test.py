@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+import uuid
+from decimal import Decimal
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../../')))
+
+from infrastructure.psql.testing import fake_result, fake_session
+from infrastructure.psql.db import AFTER_COMMIT
+from source.user.application.use_cases.get_balances.use_case import GetBalancesUseCase
+from source.user.infrastructure.balance_cache import BalanceCache
+from source.user.infrastructure import balance_mutations
+
+class TestGetBalancesUseCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.user_id = str(uuid.uuid4())
+        self.db = fake_session()
+        self.db.execute.return_value = fake_result([("ARS", Decimal("0")), ("USD", Decimal("10"))])
+        self.cache = BalanceCache(max_size=10, ttl=60)
+        self.use_case = GetBalancesUseCase(self.db, cache=self.cache)
+
+    async def test_second_read_is_served_from_cache(self):
+        first = await self.use_case.execute(self.user_id)
+        second = await self.use_case.execute(self.user_id)
+
+        self.assertEqual(first, {"ARS": Decimal("0"), "USD": Decimal("10")})
+        self.assertEqual(second, first)
+        self.db.execute.assert_awaited_once()
+
+    async def test_unknown_user(self):
+        self.db.execute.return_value = fake_result([])
+
+        with self.assertRaises(ValueError) as context:
+            await self.use_case.execute(self.user_id)
+
+        self.assertEqual(str(context.exception), "User not found")
+
+    async def test_committed_balance_change_invalidates_cache(self):
+        await self.use_case.execute(self.user_id)
+
+        with patch.object(balance_mutations, "balance_cache", self.cache):
+            self.db.execute.return_value = fake_result([("USD", Decimal("15"))])
+            await balance_mutations.apply_balance_changes(self.db, self.user_id, {"USD": Decimal("5")})
+            self.assertIsNotNone(self.cache.get(self.user_id))
+
+            for callback in self.db.info.pop(AFTER_COMMIT):
+                callback()
+
+        self.assertIsNone(self.cache.get(self.user_id))
+
+if __name__ == "__main__":
+    unittest.main()
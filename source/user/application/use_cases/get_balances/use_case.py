@@ -0,0 +1,32 @@
+from decimal import Decimal
+from typing import Dict
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from source.user.domain.entities.user_balance.user_balance_entity import UserBalance
+from source.user.infrastructure.balance_cache import BalanceCache, balance_cache
+from infrastructure.metrics import USE_CASE_SECONDS, timed
+
+class GetBalancesUseCase:
+    def __init__(self, db: AsyncSession, cache: BalanceCache = balance_cache):
+        self.db = db
+        self.cache = cache
+
+    @timed(USE_CASE_SECONDS, "GetBalancesUseCase")
+    async def execute(self, user_id: str) -> Dict[str, Decimal]:
+        user_id = str(user_id)
+        balances = self.cache.get(user_id)
+        if balances is not None:
+            return balances
+
+        token = self.cache.token()
+        result = await self.db.execute(
+            select(UserBalance.currency, UserBalance.amount)
+            .where(UserBalance.user_id == user_id)
+            .order_by(UserBalance.currency)
+        )
+        balances = {currency: amount or Decimal("0") for currency, amount in result.all()}
+        if not balances:
+            raise ValueError('User not found')
+
+        self.cache.put(user_id, balances, token)
+        return balances
@@ -1,5 +1,5 @@
 import decimal
-from sqlalchemy import Column, Integer, Numeric, ForeignKey, String
+from sqlalchemy import Column, Index, Integer, Numeric, ForeignKey, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from decimal import Decimal
@@ -7,6 +7,10 @@ from infrastructure.psql.db import Base
 
 class UserBalance(Base):
     __tablename__ = "user_balance"
+    __table_args__ = (
+        # One row per (user, currency); every deposit and swap looks balances up this way.
+        Index("uq_user_balance_user_id_currency", "user_id", "currency", unique=True),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -13,6 +13,7 @@ class User(Base):
     balances = relationship("UserBalance", back_populates="user", cascade="all, delete-orphan")
 
     def __init__(self, name: str):
+        self.id = uuid.uuid4()
         self.name = name
 
     def to_dict(self) -> Dict:
@@ -0,0 +1,77 @@
+import os
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class BalanceCache:
+    """
+    Bounded in-process cache of each user's balances by currency.
+
+    Writers invalidate a user after their transaction commits. A reader takes a
+    `token()` before querying and only stores what it read if the user was not
+    invalidated in the meantime, so a read racing a write can't put
+    pre-commit balances back. Entries also expire after `ttl` seconds, which
+    bounds how long writes made by other workers go unseen.
+    """
+
+    def __init__(self, max_size: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Decimal], float]]" = OrderedDict()
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str) -> Optional[Dict[str, Decimal]]:
+        entry = self._entries.get(user_id)
+        if entry is not None and self._clock() - entry[1] <= self.ttl:
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return dict(entry[0])
+        if entry is not None:
+            del self._entries[user_id]
+        self.misses += 1
+        return None
+
+    def token(self) -> int:
+        return self._version
+
+    def put(self, user_id: str, balances: Dict[str, Decimal], token: int) -> None:
+        if self._invalidated.get(user_id, -1) >= token:
+            return
+        self._entries[user_id] = (dict(balances), self._clock())
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        self._entries.pop(user_id, None)
+        self._invalidated[user_id] = self._version
+        self._invalidated.move_to_end(user_id)
+        self._version += 1
+        while len(self._invalidated) > self.max_size:
+            self._invalidated.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._invalidated.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+        }
+
+balance_cache = BalanceCache(
+    max_size=int(os.getenv("BALANCE_CACHE_MAX_SIZE", "100000")),
+    ttl=float(os.getenv("BALANCE_CACHE_TTL", "2")),
+)
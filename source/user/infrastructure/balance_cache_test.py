@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+
+from source.user.infrastructure.balance_cache import BalanceCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestBalanceCache(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = BalanceCache(max_size=2, ttl=5, clock=self.clock)
+        self.balances = {"USD": Decimal("10"), "ARS": Decimal("0")}
+
+    def test_put_then_get(self):
+        self.cache.put("alice", self.balances, self.cache.token())
+
+        self.assertEqual(self.cache.get("alice"), self.balances)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_entries_expire(self):
+        self.cache.put("alice", self.balances, self.cache.token())
+        self.clock.now = 6
+
+        self.assertIsNone(self.cache.get("alice"))
+
+    def test_invalidate_drops_entry(self):
+        self.cache.put("alice", self.balances, self.cache.token())
+        self.cache.invalidate("alice")
+
+        self.assertIsNone(self.cache.get("alice"))
+
+    def test_read_racing_a_write_is_not_stored(self):
+        token = self.cache.token()
+        self.cache.invalidate("alice")
+        self.cache.put("alice", self.balances, token)
+
+        self.assertIsNone(self.cache.get("alice"))
+
+    def test_read_after_a_write_is_stored(self):
+        self.cache.invalidate("alice")
+        self.cache.put("alice", self.balances, self.cache.token())
+
+        self.assertEqual(self.cache.get("alice"), self.balances)
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put("alice", self.balances, self.cache.token())
+        self.cache.put("bob", self.balances, self.cache.token())
+        self.cache.get("alice")
+        self.cache.put("carol", self.balances, self.cache.token())
+
+        self.assertIsNone(self.cache.get("bob"))
+        self.assertIsNotNone(self.cache.get("alice"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import uuid
+from decimal import Decimal
+from typing import Dict, Iterable, Set, Tuple
+from sqlalchemy import String, Numeric, case, column, func, or_, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from infrastructure.psql.db import after_commit
+from infrastructure.psql.replica import recent_writes
+from source.common_types.currency_types import CurrencyType
+from source.user.domain.entities.user_balance.user_balance_entity import UserBalance
+from source.user.infrastructure.balance_cache import balance_cache
+
+async def apply_balance_changes(db: AsyncSession, user_id: str, changes: Dict[str, Decimal]) -> Dict[str, Decimal]:
+    """
+    Applies signed per-currency changes to a user's balances in a single
+    conditional UPDATE ... RETURNING and returns the new amounts by currency.
+
+    An UPDATE locks rows in whatever order its plan scans them, so when more
+    than one balance changes the rows are first locked through `lock_balances`,
+    in the same (user_id, currency) order the batch paths use; opposite-direction
+    swaps and batches then cannot deadlock. A single row needs no ordering.
+
+    Debits only apply when the balance covers them, so the check and the write
+    happen atomically in the database. If any change does not apply a ValueError
+    is raised and the caller's transaction must be rolled back. The user's cached
+    balances are invalidated once the transaction commits.
+    """
+    changes = {CurrencyType(currency).value: Decimal(str(delta)) for currency, delta in changes.items()}
+    if len(changes) > 1:
+        await lock_balances(db, [(user_id, currency) for currency in changes])
+
+    # A row is only updated if it is not debited, or if it covers the debit.
+    covered = [
+        or_(UserBalance.currency != currency, UserBalance.amount >= -delta)
+        for currency, delta in changes.items()
+        if delta < 0
+    ]
+
+    result = await db.execute(
+        update(UserBalance)
+        .where(
+            UserBalance.user_id == user_id,
+            UserBalance.currency.in_(list(changes)),
+            *covered,
+        )
+        .values(amount=func.coalesce(UserBalance.amount, 0) + case(changes, value=UserBalance.currency))
+        .returning(UserBalance.currency, UserBalance.amount)
+        .execution_options(synchronize_session=False)
+    )
+    amounts = {currency: amount for currency, amount in result.all()}
+
+    missing = [currency for currency in changes if currency not in amounts]
+    if missing:
+        await _raise_for_missing(db, user_id, missing)
+
+    _invalidate_after_commit(db, [user_id])
+    return amounts
+
+async def apply_balance_increments(db: AsyncSession, increments: Dict[Tuple[str, str], Decimal]) -> Set[Tuple[str, str]]:
+    """
+    Adds increments to many (user_id, currency) balances with a single
+    UPDATE ... FROM (VALUES ...) and returns the pairs that were updated.
+
+    Pairs without a balance row are simply not returned; the caller decides what
+    to do with them. The UPDATE locks rows in whatever order the planner's join
+    produces, so callers must hold the rows from `lock_balances` first; that
+    also covers debits, which are not checked against the balance here.
+    Cached balances of the updated users are invalidated once the transaction
+    commits.
+    """
+    if not increments:
+        return set()
+
+    rows = sorted(
+        (uuid.UUID(str(user_id)), CurrencyType(currency).value, Decimal(str(delta)))
+        for (user_id, currency), delta in increments.items()
+    )
+    increment = values(
+        column("user_id", UUID(as_uuid=True)),
+        column("currency", String),
+        column("delta", Numeric(precision=18, scale=8)),
+        name="increment",
+    ).data(rows)
+
+    result = await db.execute(
+        update(UserBalance)
+        .where(
+            UserBalance.user_id == increment.c.user_id,
+            UserBalance.currency == increment.c.currency,
+        )
+        .values(amount=func.coalesce(UserBalance.amount, 0) + increment.c.delta)
+        .returning(UserBalance.user_id, UserBalance.currency)
+        .execution_options(synchronize_session=False)
+    )
+    applied = {(str(user_id), currency) for user_id, currency in result.all()}
+    _invalidate_after_commit(db, {user_id for user_id, _ in applied})
+    return applied
+
+async def lock_balances(db: AsyncSession, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Decimal]:
+    """
+    Locks the given (user_id, currency) balances with SELECT ... FOR UPDATE and
+    returns their amounts. Rows are locked in (user_id, currency) order, so two
+    transactions locking overlapping sets cannot deadlock on each other.
+    """
+    keys = sorted({(uuid.UUID(str(user_id)), CurrencyType(currency).value) for user_id, currency in pairs})
+    if not keys:
+        return {}
+
+    result = await db.execute(
+        select(UserBalance.user_id, UserBalance.currency, UserBalance.amount)
+        .where(tuple_(UserBalance.user_id, UserBalance.currency).in_(keys))
+        .order_by(UserBalance.user_id, UserBalance.currency)
+        .with_for_update()
+    )
+    return {(str(user_id), currency): amount or Decimal("0") for user_id, currency, amount in result.all()}
+
+async def describe_missing_balances(db: AsyncSession, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+    """Explains, with one query, why each (user_id, currency) pair has no balance row."""
+    pairs = list(pairs)
+    if not pairs:
+        return {}
+
+    result = await db.execute(
+        select(UserBalance.user_id)
+        .where(UserBalance.user_id.in_({uuid.UUID(str(user_id)) for user_id, _ in pairs}))
+        .distinct()
+    )
+    known_users = {str(user_id) for user_id in result.scalars().all()}
+
+    return {
+        (user_id, currency): f'Balance for {currency} not found' if user_id in known_users else 'User not found'
+        for user_id, currency in pairs
+    }
+
+def _invalidate_after_commit(db: AsyncSession, user_ids) -> None:
+    user_ids = [str(user_id) for user_id in user_ids]
+    if user_ids:
+        after_commit(db, lambda: _on_committed(user_ids))
+
+def _on_committed(user_ids) -> None:
+    for user_id in user_ids:
+        balance_cache.invalidate(user_id)
+        recent_writes.record(user_id)
+
+async def _raise_for_missing(db: AsyncSession, user_id: str, missing: list) -> None:
+    # Only reached on failure: tell a missing balance apart from an insufficient one.
+    result = await db.execute(
+        select(UserBalance.currency).where(UserBalance.user_id == user_id)
+    )
+    existing = set(result.scalars().all())
+    if not existing:
+        raise ValueError('User not found')
+
+    for currency in missing:
+        if currency not in existing:
+            raise ValueError(f'Balance for {currency} not found')
+
+    raise ValueError("Insufficient balance.")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import unittest
+import uuid
+from decimal import Decimal
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+
+from infrastructure.psql.testing import compiled_sql, fake_result, fake_session
+from source.user.infrastructure.balance_mutations import apply_balance_changes
+
+class TestApplyBalanceChanges(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.user_id = str(uuid.uuid4())
+        self.db = fake_session()
+
+    def _sql(self, index: int = 0) -> str:
+        return compiled_sql(self.db.execute.await_args_list[index])
+
+    async def test_returns_new_amounts(self):
+        self.db.execute.return_value = fake_result([("USD", Decimal("150"))])
+
+        amounts = await apply_balance_changes(self.db, self.user_id, {"USD": Decimal("50")})
+
+        self.assertEqual(amounts, {"USD": Decimal("150")})
+        self.db.execute.assert_awaited_once()
+        self.assertIn("RETURNING user_balance.currency, user_balance.amount", self._sql())
+
+    async def test_debit_is_conditional_on_available_amount(self):
+        self.db.execute.side_effect = [
+            fake_result([]),
+            fake_result([("USD", Decimal("90")), ("ARS", Decimal("4000"))]),
+        ]
+
+        await apply_balance_changes(self.db, self.user_id, {"USD": Decimal("-10"), "ARS": Decimal("4000")})
+
+        sql = self._sql(1)
+        self.assertIn("(user_balance.currency != %(currency_2)s OR user_balance.amount >= %(amount_1)s)", sql)
+        self.assertIn("CASE user_balance.currency", sql)
+
+    async def test_locks_both_rows_in_order_before_updating(self):
+        self.db.execute.side_effect = [
+            fake_result([]),
+            fake_result([("ARS", Decimal("4000")), ("USD", Decimal("90"))]),
+        ]
+
+        await apply_balance_changes(self.db, self.user_id, {"USD": Decimal("-10"), "ARS": Decimal("4000")})
+
+        self.assertEqual(self.db.execute.await_count, 2)
+        lock_sql = compiled_sql(self.db.execute.await_args_list[0], literal_binds=True)
+        self.assertTrue(lock_sql.endswith("FOR UPDATE"))
+        self.assertIn("ORDER BY user_balance.user_id, user_balance.currency", lock_sql)
+        # The IN list is sorted too, so ARS is requested before USD.
+        self.assertLess(lock_sql.index("'ARS'"), lock_sql.index("'USD'"))
+        self.assertTrue(self._sql(1).startswith("UPDATE user_balance"))
+
+    async def test_single_balance_is_not_locked_separately(self):
+        self.db.execute.return_value = fake_result([("USD", Decimal("150"))])
+
+        await apply_balance_changes(self.db, self.user_id, {"USD": Decimal("50")})
+
+        self.assertFalse(self._sql().endswith("FOR UPDATE"))
+
+    async def test_insufficient_balance(self):
+        self.db.execute.side_effect = [fake_result([]), fake_result(["USD", "ARS"])]
+
+        with self.assertRaises(ValueError) as context:
+            await apply_balance_changes(self.db, self.user_id, {"USD": Decimal("-10")})
+
+        self.assertEqual(str(context.exception), "Insufficient balance.")
+
+    async def test_missing_balance(self):
+        self.db.execute.side_effect = [fake_result([]), fake_result(["USD"])]
+
+        with self.assertRaises(ValueError) as context:
+            await apply_balance_changes(self.db, self.user_id, {"BTC": Decimal("1")})
+
+        self.assertEqual(str(context.exception), "Balance for BTC not found")
+
+    async def test_unknown_user(self):
+        self.db.execute.side_effect = [fake_result([]), fake_result([])]
+
+        with self.assertRaises(ValueError) as context:
+            await apply_balance_changes(self.db, self.user_id, {"USD": Decimal("1")})
+
+        self.assertEqual(str(context.exception), "User not found")
+
+if __name__ == "__main__":
+    unittest.main()
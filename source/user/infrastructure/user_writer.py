@@ -0,0 +1,20 @@
+from typing import List
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from source.user.domain.entities.user_entity import User
+from source.user.domain.entities.user_balance.user_balance_entity import UserBalance
+
+async def insert_users(db: AsyncSession, users: List[User]) -> None:
+    """
+    Writes users and their balances with two executemany INSERTs instead of
+    one ORM flush per row. User ids are generated client-side, so balances can
+    reference them without reading anything back.
+    """
+    if not users:
+        return
+    await db.execute(insert(User), [{"id": user.id, "name": user.name} for user in users])
+    await db.execute(insert(UserBalance), [
+        {"user_id": user.id, "currency": balance.currency, "amount": balance.amount}
+        for user in users
+        for balance in user.balances
+    ])